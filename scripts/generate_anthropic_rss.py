@@ -5,25 +5,51 @@ Replaces the functionality previously handled by GeminiCLI and improves article
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import xml.etree.ElementTree as ET
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
-import sys
 from urllib.parse import urljoin
-import time
 import json
 import re
+from functools import lru_cache
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 import hashlib
 
+# orjson decodes the large Next.js payloads much faster; fall back to the stdlib if absent.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the same except clause covers both.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# A single page request per run; retry brief server errors before falling back to Selenium
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+))
+
+# Page body and HTTP validators kept between runs for conditional requests
+PAGE_CACHE_PATH = '.cache/anthropic-news-page.json'
+
+# Write buffer for the RSS output, large enough to flush the whole feed at once
+RSS_WRITE_BUFFER_SIZE = 1 << 16
+
+# Matches hrefs of news article links, both relative and absolute
+NEWS_HREF_RE = re.compile(r'/news/')
+
 def load_existing_articles(rss_file_path):
     """Load existing articles from RSS file to preserve dates and avoid duplicates."""
     existing_articles = {}
@@ -123,6 +149,13 @@ def create_stable_date(title, link):
     
     return stable_date.strftime('%d %b %Y %H:%M:%S +0000')
 
+@lru_cache(maxsize=None)
+def get_chromedriver_path():
+    """Resolve the chromedriver binary once per process."""
+    # Use a preinstalled driver when CHROMEDRIVER_PATH is set, which skips
+    # ChromeDriverManager's version lookup over the network entirely
+    return os.environ.get('CHROMEDRIVER_PATH') or ChromeDriverManager().install()
+
 def setup_driver():
     """Setup Chrome driver with appropriate options for both local and CI environments."""
     chrome_options = Options()
@@ -132,10 +165,14 @@ def setup_driver():
     chrome_options.add_argument('--disable-gpu')
     chrome_options.add_argument('--window-size=1920,1080')
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    # Images and notifications are never needed for scraping, so don't download them
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2
+    })
     
     try:
-        # Try to use ChromeDriverManager for automatic driver management
-        service = Service(ChromeDriverManager().install())
+        service = Service(get_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
     except Exception as e:
         print(f"Failed to setup Chrome driver with ChromeDriverManager: {e}")
@@ -148,68 +185,61 @@ def setup_driver():
     
     return driver
 
-def extract_articles_from_json(page_source):
-    """Extract article data from Next.js page JSON data."""
+def extract_articles_from_json(page_source, max_articles=15):
+    """Extract up to max_articles article data from Next.js page JSON data."""
     articles = []
+    # The same article can appear in several JSON blobs; drop repeats as they are found
+    seen_keys = set()
     
-    # Look for JSON data in script tags that might contain article information
-    soup = BeautifulSoup(page_source, 'html.parser')
-    script_tags = soup.find_all('script', type='application/json')
+    # Only <script> elements are needed, so build a tree of those alone
+    soup = BeautifulSoup(page_source, 'lxml', parse_only=SoupStrainer('script'))
     
-    for script in script_tags:
-        try:
-            data = json.loads(script.get_text())
-            # Search for article-like data structures
-            articles_data = find_articles_in_json(data)
-            if articles_data:
-                articles.extend(articles_data)
-        except (json.JSONDecodeError, KeyError) as e:
+    # Look for JSON data in script tags (including the inline Next.js data) in one scan,
+    # so a __NEXT_DATA__ tag that is also application/json is parsed only once
+    for script in soup.find_all('script'):
+        if script.get('type') != 'application/json' and '__NEXT_DATA__' not in script.get('id', ''):
             continue
-    
-    # Also look for inline script tags with Next.js data
-    script_tags_inline = soup.find_all('script', id=re.compile(r'__NEXT_DATA__'))
-    for script in script_tags_inline:
+        
         try:
-            data = json.loads(script.get_text())
-            articles_data = find_articles_in_json(data)
-            if articles_data:
-                articles.extend(articles_data)
+            data = json_loads(script.get_text())
+            # Search for article-like data structures
+            for article in iter_articles_in_json(data):
+                article_key = create_article_key(article['title'], article['link'])
+                if article_key not in seen_keys:
+                    seen_keys.add(article_key)
+                    articles.append(article)
+                    # Stop walking the JSON as soon as enough articles are collected
+                    if len(articles) >= max_articles:
+                        return translate_articles(articles)
         except (json.JSONDecodeError, KeyError) as e:
             continue
     
-    # Remove duplicates based on link
-    seen_keys = set()
-    unique_articles = []
-    for article in articles:
-        article_key = create_article_key(article['title'], article['link'])
-        if article_key not in seen_keys:
-            seen_keys.add(article_key)
-            unique_articles.append(article)
-    
-    return unique_articles
+    return translate_articles(articles)
 
-def find_articles_in_json(data, path=""):
-    """Recursively search for article data in JSON structure."""
-    articles = []
-    
-    if isinstance(data, dict):
-        # Look for fields that might contain article data
-        if 'slug' in data and 'title' in data:
-            # This looks like an article object
-            article = extract_article_from_object(data)
-            if article:
-                articles.append(article)
+def iter_articles_in_json(data):
+    """Yield article data found in a JSON structure, in document order."""
+    # Iterative depth-first walk with an explicit stack instead of recursion.
+    # Children are pushed in reverse so they are visited in their original order.
+    stack = [data]
+    while stack:
+        node = stack.pop()
         
-        # Recursively search in all dictionary values
-        for key, value in data.items():
-            articles.extend(find_articles_in_json(value, f"{path}.{key}"))
-    
-    elif isinstance(data, list):
-        # Search in list items
-        for i, item in enumerate(data):
-            articles.extend(find_articles_in_json(item, f"{path}[{i}]"))
-    
-    return articles
+        if isinstance(node, dict):
+            # Look for fields that might contain article data
+            if 'slug' in node and 'title' in node:
+                # This looks like an article object
+                article = extract_article_from_object(node)
+                if article:
+                    yield article
+            
+            stack.extend(reversed(list(node.values())))
+        
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+def find_articles_in_json(data):
+    """Search for article data in JSON structure."""
+    return list(iter_articles_in_json(data))
 
 def extract_article_from_object(obj):
     """Extract article information from a JSON object."""
@@ -256,14 +286,11 @@ def extract_article_from_object(obj):
         elif len(description) > 200:
             description = description[:200] + "..."
         
-        # Apply simple Japanese translation
-        title_ja = translate_simple(title)
-        description_ja = translate_simple(description)
-        
+        # Translation is applied later in one batch, once the article survives dedupe and the limit
         return {
-            'title': title_ja,
+            'title': title,
             'link': link,
-            'description': description_ja,
+            'description': description,
             'pubDate': formatted_date
         }
     
@@ -271,11 +298,68 @@ def extract_article_from_object(obj):
         print(f"Error extracting article from object: {e}")
         return None
 
-def scrape_anthropic_news():
-    """Scrape the Anthropic news page using Selenium for better JavaScript support."""
-    url = "https://www.anthropic.com/news"
-    driver = None
+def load_page_cache(cache_path):
+    """Load the cached page body and its validators from a previous run."""
+    if not os.path.exists(cache_path):
+        return {}
     
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not load page cache: {e}")
+        return {}
+
+def save_page_cache(cache_path, cache):
+    """Save the page body and its validators for the next run."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"Warning: Could not save page cache: {e}")
+
+def fetch_page_source(url, cache):
+    """Fetch the server-rendered HTML of a page without a browser.
+    
+    cache is the dict from load_page_cache; a fresh response is recorded in it, and the
+    caller saves it with save_page_cache only once the page turned out to be usable.
+    Returns (html, not_modified), where not_modified is True when the server answered 304
+    and html is the cached copy; html is None if the request failed.
+    """
+    headers = {"User-Agent": "Mozilla/5.0"}
+    
+    # Revalidate the copy from the previous run so an unchanged page comes back as 304
+    if cache.get('url') == url and cache.get('body'):
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache.get('last_modified'):
+            headers['If-Modified-Since'] = cache['last_modified']
+    
+    try:
+        response = SESSION.get(url, headers=headers, timeout=30)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching page over HTTP: {e}")
+        return None, False
+    
+    if response.status_code == 304 and cache.get('body'):
+        print("Page not modified since last run, using cached copy")
+        return cache['body'], True
+    
+    cache.clear()
+    cache.update({
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'body': response.text
+    })
+    
+    return response.text, False
+
+def fetch_page_source_with_selenium(url):
+    """Render a page in headless Chrome and return its HTML."""
+    driver = None
     try:
         print("Setting up Chrome driver...")
         driver = setup_driver()
@@ -287,23 +371,56 @@ def scrape_anthropic_news():
         print("Waiting for page content to load...")
         wait = WebDriverWait(driver, 30)
         
-        # Wait for any article elements or links to appear
+        # Wait for the Next.js data script or the first news link, whichever comes first
         try:
-            wait.until(lambda d: len(d.find_elements(By.TAG_NAME, "a")) > 10)
+            wait.until(EC.any_of(
+                EC.presence_of_element_located((By.ID, '__NEXT_DATA__')),
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'a[href*="/news/"]'))
+            ))
         except TimeoutException:
             print("Timeout waiting for page content, proceeding with current state...")
         
-        # Add additional wait to ensure JavaScript has finished
-        time.sleep(5)
-        
-        # Extract articles from JSON data first (more reliable)
-        print("Extracting articles from page JSON data...")
-        articles = extract_articles_from_json(driver.page_source)
-        
-        # If no articles found in JSON, fall back to DOM parsing
-        if not articles:
-            print("No articles found in JSON data, trying DOM parsing...")
-            articles = extract_articles_from_dom(driver.page_source, url)
+        return driver.page_source
+    
+    finally:
+        if driver:
+            driver.quit()
+
+def parse_articles(page_source, base_url="https://www.anthropic.com/news"):
+    """Extract up to 15 articles from a rendered news page, preferring its embedded JSON data."""
+    # Extract articles from JSON data first (more reliable)
+    print("Extracting articles from page JSON data...")
+    articles = extract_articles_from_json(page_source)
+    
+    # If no articles found in JSON, fall back to DOM parsing
+    if not articles:
+        print("No articles found in JSON data, trying DOM parsing...")
+        articles = extract_articles_from_dom(page_source, base_url)
+    
+    return articles[:15]  # Limit to 15 articles
+
+def scrape_anthropic_news(cache_path=PAGE_CACHE_PATH):
+    """Scrape the Anthropic news page, using Selenium only when plain HTTP is not enough."""
+    url = "https://www.anthropic.com/news"
+    
+    # The Next.js page usually ships its article JSON in the server-rendered HTML,
+    # so try a plain GET first and skip launching Chrome when that is enough
+    print(f"Fetching page over HTTP: {url}")
+    cache = load_page_cache(cache_path)
+    page_source, not_modified = fetch_page_source(url, cache)
+    if page_source:
+        articles = extract_articles_from_json(page_source)
+        if articles:
+            # Only a page with article JSON is cached, so a 304 never revalidates a page that needed Selenium
+            # (after a 304 the cached copy is already on disk and there is nothing new to save)
+            if not not_modified:
+                save_page_cache(cache_path, cache)
+            print(f"Successfully extracted {len(articles)} articles without a browser")
+            return articles[:15]  # Limit to 15 articles
+        print("No articles found in server-rendered HTML, falling back to Selenium...")
+    
+    try:
+        articles = parse_articles(fetch_page_source_with_selenium(url), url)
         
         # If still no articles, create fallback
         if not articles:
@@ -316,7 +433,7 @@ def scrape_anthropic_news():
             }]
         
         print(f"Successfully extracted {len(articles)} articles")
-        return articles[:15]  # Limit to 15 articles
+        return articles
         
     except Exception as e:
         print(f"Error scraping Anthropic news: {e}")
@@ -327,26 +444,28 @@ def scrape_anthropic_news():
             'description': 'ニュースの取得中にエラーが発生しました。最新情報については Anthropic 公式サイトをご確認ください。',
             'pubDate': datetime.now().strftime('%d %b %Y %H:%M:%S +0000')
         }]
-    
-    finally:
-        if driver:
-            driver.quit()
 
-def extract_articles_from_dom(page_source, base_url):
+def parse_news_links(page_source):
+    """Parse page HTML into a tree that only holds links that appear to be news articles."""
+    return BeautifulSoup(page_source, 'lxml', parse_only=SoupStrainer('a', href=NEWS_HREF_RE))
+
+def extract_articles_from_dom(page_source, base_url, max_articles=10):
     """Fallback method to extract articles from DOM when JSON extraction fails."""
-    soup = BeautifulSoup(page_source, 'html.parser')
+    return extract_articles_from_links(parse_news_links(page_source), base_url, max_articles)
+
+def extract_articles_from_links(soup, base_url, max_articles=10):
+    """Extract articles from news links already parsed with parse_news_links."""
     articles = []
+    seen_links = set()
     
-    # Look for links that appear to be news articles
-    links = soup.find_all('a', href=True)
+    links = soup.find_all('a')
     
     for link in links:
         href = link.get('href', '')
         text = link.get_text(strip=True)
         
-        # Filter for news article links
-        if (('/news/' in href or href.startswith('/news/')) and 
-            text and len(text) > 10 and len(text) < 200):
+        # Filter for link texts that look like article titles
+        if 10 < len(text) < 200:
             
             # Build full URL
             if href.startswith('/'):
@@ -354,62 +473,94 @@ def extract_articles_from_dom(page_source, base_url):
             else:
                 full_url = urljoin(base_url, href)
             
-            # Simple Japanese translation
-            title_ja = translate_simple(text)
+            # Skip duplicates before doing any translation work
+            if full_url in seen_links:
+                continue
+            seen_links.add(full_url)
             
             articles.append({
-                'title': title_ja,
+                'title': text,
                 'link': full_url,
-                'description': translate_simple("記事の詳細については、リンク先をご確認ください。"),
-                'pubDate': create_stable_date(title_ja, full_url)
+                'description': "記事の詳細については、リンク先をご確認ください。"
             })
+            
+            # Stop scanning links once the limit is reached
+            if len(articles) >= max_articles:
+                break
     
-    # Remove duplicates based on link
-    seen_links = set()
-    unique_articles = []
+    # Simple Japanese translation, then derive stable dates from the translated titles
+    translate_articles(articles)
     for article in articles:
-        if article['link'] not in seen_links:
-            seen_links.add(article['link'])
-            unique_articles.append(article)
+        article['pubDate'] = create_stable_date(article['title'], article['link'])
     
-    return unique_articles[:10]  # Limit to 10 articles
+    return articles
+
+TRANSLATIONS = [
+    ('artificial intelligence', '人工知能'),
+    ('machine learning', '機械学習'),
+    ('announcement', '発表'),
+    ('research', '研究'),
+    ('release', 'リリース'),
+    ('update', 'アップデート'),
+    ('safety', '安全性'),
+    ('latest', '最新'),
+    ('news', 'ニュース'),
+    ('blog', 'ブログ'),
+    ('post', '投稿'),
+    ('new', '新しい')
+]
+
+# 長い単語から順に並べて部分一致の問題を回避（"news"は"new"より先に一致する）。
+# 並べ替えとパターンのコンパイルはimport時に一度だけ行い、テキストを1回の走査で置換する
+TRANSLATION_LOOKUP = dict(TRANSLATIONS)
+TRANSLATION_PATTERN = re.compile(
+    '|'.join(re.escape(en) for en in sorted(TRANSLATION_LOOKUP, key=len, reverse=True))
+)
+
+# Every keyword contains ASCII letters, so text without any (e.g. already Japanese) needs no scan
+ASCII_LETTER_RE = re.compile(r'[A-Za-z]')
 
 def translate_simple(text):
     """Simple translation using keyword replacement (fallback for Gemini translation)."""
-    # 長い単語から順に置換して部分一致の問題を回避
-    translations = [
-        ('artificial intelligence', '人工知能'),
-        ('machine learning', '機械学習'),
-        ('announcement', '発表'),
-        ('research', '研究'),
-        ('release', 'リリース'),
-        ('update', 'アップデート'),
-        ('safety', '安全性'),
-        ('latest', '最新'),
-        ('news', 'ニュース'),  # "new"より前に処理
-        ('blog', 'ブログ'),
-        ('post', '投稿'),
-        ('new', '新しい'),    # より短い単語は後に処理
-        ('Anthropic', 'Anthropic'),
-        ('Claude', 'Claude'),
-        ('AI', 'AI')
-    ]
-    
-    translated = text
-    for en, ja in translations:
-        translated = translated.replace(en, ja)
-    
-    return translated
+    if not ASCII_LETTER_RE.search(text):
+        return text
+    
+    return TRANSLATION_PATTERN.sub(lambda m: TRANSLATION_LOOKUP[m.group(0)], text)
+
+# Joins article fields for batch translation; no keyword or replacement contains it
+ARTICLE_FIELD_SEPARATOR = '\x1e'
+
+def translate_articles(articles):
+    """Translate the titles and descriptions of all articles in a single pass, in place."""
+    if not articles:
+        return articles
+    
+    fields = []
+    for article in articles:
+        fields.append(article['title'].replace(ARTICLE_FIELD_SEPARATOR, ' '))
+        fields.append(article['description'].replace(ARTICLE_FIELD_SEPARATOR, ' '))
+    
+    translated = translate_simple(ARTICLE_FIELD_SEPARATOR.join(fields)).split(ARTICLE_FIELD_SEPARATOR)
+    for article, title, description in zip(articles, translated[0::2], translated[1::2]):
+        article['title'] = title
+        article['description'] = description
+    
+    return articles
 
 def format_date(date_str):
     """Format date string to RFC-822 format."""
     try:
-        # Try parsing various date formats
+        # ISO形式（'Z'付きやマイクロ秒付きを含む）はfromisoformatで一度に解析
+        try:
+            dt = datetime.fromisoformat(date_str)
+            if dt.tzinfo is not None:
+                dt = dt.astimezone(timezone.utc)
+            return dt.strftime('%d %b %Y %H:%M:%S +0000')
+        except ValueError:
+            pass
+        
+        # Try parsing the remaining non-ISO formats
         formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S.%fZ',
             '%d %b %Y',
             '%B %d, %Y'
         ]
@@ -501,13 +652,12 @@ def main():
     print("Generating RSS feed...")
     rss_element = generate_rss_feed(articles)
     
-    # Create XML string with proper formatting
+    # Write to a temporary file and rename it into place, so readers never see a partial feed
     ET.indent(rss_element, space="  ", level=0)
-    xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(rss_element, encoding='unicode')
-    
-    # Write to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(xml_str)
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb', buffering=RSS_WRITE_BUFFER_SIZE) as f:
+        ET.ElementTree(rss_element).write(f, encoding='utf-8', xml_declaration=True)
+    os.replace(tmp_path, output_path)
     
     print(f"RSS feed generated successfully: {output_path}")
     
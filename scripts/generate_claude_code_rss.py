@@ -4,11 +4,21 @@ Script to generate an RSS feed for the commit history of the claude-code GitHub
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
 from datetime import datetime
 import os
 import re
 
+# One GitHub API call per run; retry only the gateway errors GitHub returns transiently
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=(502, 503, 504))
+))
+
 def get_repo_name_from_url(url):
     """Extracts the repository name from a GitHub API URL."""
     match = re.search(r'repos/([^/]+/[^/]+)/commits', url)
@@ -37,7 +47,7 @@ def load_existing_commits(rss_file_path):
 def fetch_claude_code_commits(api_url="https://api.github.com/repos/anthropics/claude-code/commits"):
     """Fetch the latest commits from the GitHub API."""
     try:
-        response = requests.get(api_url, headers={'Accept': 'application/vnd.github.v3+json'})
+        response = SESSION.get(api_url, headers={'Accept': 'application/vnd.github.v3+json'})
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -154,10 +164,10 @@ def main():
     rss_element = generate_rss_feed(latest_commits, existing_commits, repo_name)
 
     ET.indent(rss_element, space="  ", level=0)
-    xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(rss_element, encoding='unicode')
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(xml_str)
+    # Stream the tree into a temporary file, then rename it over the old feed
+    tmp_path = output_path + '.tmp'
+    ET.ElementTree(rss_element).write(tmp_path, encoding='utf-8', xml_declaration=True)
+    os.replace(tmp_path, output_path)
 
     print(f"RSS feed generated successfully: {output_path}")
 
@@ -6,23 +6,33 @@ Script to generate an RSS feed for the Hanaregumi Live News page.
 import re
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
 from bs4 import BeautifulSoup
 
 NEWS_URL = "https://www.hanaregumi.jp/news_category/live"
 
+# Retry the news page request on transient server errors
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+))
+
 
 def fetch_live_news(url: str) -> list[dict]:
     """Fetch and parse Live News articles from the Hanaregumi website."""
     try:
-        response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
+        response = SESSION.get(url, headers={"User-Agent": "Mozilla/5.0"})
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         print(f"Error fetching page: {e}")
         return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.content, "lxml")
     articles = []
 
     for a in soup.find_all("a", href=re.compile(r"hanaregumi\.jp/news/\d+")):
@@ -92,10 +102,10 @@ def main():
 
     rss = generate_rss(articles)
     ET.indent(rss, space="  ", level=0)
-    xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(rss, encoding="unicode")
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(xml_str)
+    # Write without building the whole document as a string first
+    tmp_path = output_path + ".tmp"
+    ET.ElementTree(rss).write(tmp_path, encoding="utf-8", xml_declaration=True)
+    os.replace(tmp_path, output_path)
 
     print(f"RSS feed generated: {output_path}")
 
@@ -4,6 +4,8 @@ Script to generate Ollama Models RSS feed by scraping their search page.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta, timezone
@@ -12,6 +14,14 @@ import sys
 import re
 import hashlib
 
+# Retry the search page request on transient server errors
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+))
+
 def load_existing_articles(rss_file_path):
     """Load existing articles from RSS file to preserve dates and avoid duplicates."""
     existing_articles = {}
@@ -85,87 +95,88 @@ def merge_articles_with_existing(new_articles, existing_articles):
 
     return merged_articles
 
+TRANSLATIONS = [
+    ('exceptional multilingual capabilities', '卓越した多言語対応能力'),
+    ('significantly stronger coding capabilities', '大幅に強化されたコーディング能力'),
+    ('multi-agent applications', 'マルチエージェントアプリケーション'),
+    ('professional productivity', 'プロフェッショナルな生産性'),
+    ('document intelligence', 'ドキュメントインテリジェンス'),
+    ('multimodal understanding', 'マルチモーダル理解'),
+    ('proactive autonomous execution', '積極的な自律実行'),
+    ('swarm-based task orchestration', 'スウォームベースのタスクオーケストレーション'),
+    ('achieves state-of-the-art', '最先端を達成'),
+    ('multilingual capabilities', '多言語対応能力'),
+    ('document understanding', 'ドキュメント理解'),
+    ('agentic workflows', 'エージェントワークフロー'),
+    ('exceptional utility', '卓越した有用性'),
+    ('frontier-level', 'フロンティアレベル'),
+    ('next-generation', '次世代'),
+    ('flagship model', 'フラッグシップモデル'),
+    ('systems engineering', 'システムエンジニアリング'),
+    ('long-horizon tasks', '長期タスク'),
+    ('on-device deployment', 'デバイス上での展開'),
+    ('inference efficient', '推論効率が高い'),
+    ('lightweight deployment', '軽量デプロイメント'),
+    ('family of models', 'モデルファミリー'),
+    ('designed for', '向けに設計された'),
+    ('designed to', 'するように設計された'),
+    ('well-suited for', 'に適した'),
+    ('substantially', '大幅に'),
+    ('preservation', '保存'),
+    ('significantly stronger', '大幅に強化された'),
+    ('predecessor', '前身'),
+    ('wide margin', '大差'),
+    ('enterprise-grade', 'エンタープライズグレード'),
+    ('compute efficiency', '計算効率'),
+    ('practical capabilities', '実用的な能力'),
+    ('optimized for', '最適化された'),
+    ('local development', 'ローカル開発'),
+    ('communicate across', 'を越えてコミュニケーション'),
+    ('harmonizes', '調和させる'),
+    ('performance', 'パフォーマンス'),
+    ('open-source', 'オープンソース'),
+    ('reasoning', '推論'),
+    ('coding', 'コーディング'),
+    ('deliver', '提供'),
+    ('upgrades', 'アップグレード'),
+    ('previous', '以前の'),
+    ('leads', 'リード'),
+    ('accuracy', '精度'),
+    ('complex', '複雑な'),
+    ('real-world', '現実世界'),
+    ('hybrid models', 'ハイブリッドモデル'),
+    ('elevate', '高める'),
+    ('collection of', 'コレクション'),
+    ('superior', '優れた'),
+    ('native', 'ネイティブ'),
+    ('balances', 'バランスをとる'),
+    ('Updated', '更新日'),
+    ('months ago', 'ヶ月前'),
+    ('month ago', 'ヶ月前'),
+    ('weeks ago', '週間前'),
+    ('week ago', '週間前'),
+    ('days ago', '日前'),
+    ('day ago', '日前'),
+    ('hours ago', '時間前'),
+    ('hour ago', '時間前'),
+    ('minutes ago', '分前'),
+    ('minute ago', '分前'),
+    ('ago', '前'),
+]
+
+# Lowercased English phrase -> Japanese, used to resolve each alternation match
+TRANSLATION_LOOKUP = {en.lower(): ja for en, ja in TRANSLATIONS}
+
+# Single case-insensitive alternation, longest phrase first so it wins over its substrings,
+# so the text is scanned once instead of once per keyword
+TRANSLATION_PATTERN = re.compile(
+    '|'.join(re.escape(en) for en in sorted(TRANSLATION_LOOKUP, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
 def translate_simple(text):
     """Simple translation using keyword replacement."""
-    translations = [
-        ('exceptional multilingual capabilities', '卓越した多言語対応能力'),
-        ('significantly stronger coding capabilities', '大幅に強化されたコーディング能力'),
-        ('multi-agent applications', 'マルチエージェントアプリケーション'),
-        ('professional productivity', 'プロフェッショナルな生産性'),
-        ('document intelligence', 'ドキュメントインテリジェンス'),
-        ('multimodal understanding', 'マルチモーダル理解'),
-        ('proactive autonomous execution', '積極的な自律実行'),
-        ('swarm-based task orchestration', 'スウォームベースのタスクオーケストレーション'),
-        ('achieves state-of-the-art', '最先端を達成'),
-        ('multilingual capabilities', '多言語対応能力'),
-        ('document understanding', 'ドキュメント理解'),
-        ('agentic workflows', 'エージェントワークフロー'),
-        ('exceptional utility', '卓越した有用性'),
-        ('frontier-level', 'フロンティアレベル'),
-        ('next-generation', '次世代'),
-        ('flagship model', 'フラッグシップモデル'),
-        ('systems engineering', 'システムエンジニアリング'),
-        ('long-horizon tasks', '長期タスク'),
-        ('on-device deployment', 'デバイス上での展開'),
-        ('inference efficient', '推論効率が高い'),
-        ('lightweight deployment', '軽量デプロイメント'),
-        ('family of models', 'モデルファミリー'),
-        ('designed for', '向けに設計された'),
-        ('designed to', 'するように設計された'),
-        ('well-suited for', 'に適した'),
-        ('substantially', '大幅に'),
-        ('preservation', '保存'),
-        ('significantly stronger', '大幅に強化された'),
-        ('predecessor', '前身'),
-        ('wide margin', '大差'),
-        ('enterprise-grade', 'エンタープライズグレード'),
-        ('compute efficiency', '計算効率'),
-        ('practical capabilities', '実用的な能力'),
-        ('optimized for', '最適化された'),
-        ('local development', 'ローカル開発'),
-        ('communicate across', 'を越えてコミュニケーション'),
-        ('harmonizes', '調和させる'),
-        ('performance', 'パフォーマンス'),
-        ('open-source', 'オープンソース'),
-        ('reasoning', '推論'),
-        ('coding', 'コーディング'),
-        ('deliver', '提供'),
-        ('upgrades', 'アップグレード'),
-        ('previous', '以前の'),
-        ('leads', 'リード'),
-        ('accuracy', '精度'),
-        ('complex', '複雑な'),
-        ('real-world', '現実世界'),
-        ('hybrid models', 'ハイブリッドモデル'),
-        ('elevate', '高める'),
-        ('collection of', 'コレクション'),
-        ('superior', '優れた'),
-        ('native', 'ネイティブ'),
-        ('balances', 'バランスをとる'),
-        ('Updated', '更新日'),
-        ('months ago', 'ヶ月前'),
-        ('month ago', 'ヶ月前'),
-        ('weeks ago', '週間前'),
-        ('week ago', '週間前'),
-        ('days ago', '日前'),
-        ('day ago', '日前'),
-        ('hours ago', '時間前'),
-        ('hour ago', '時間前'),
-        ('minutes ago', '分前'),
-        ('minute ago', '分前'),
-        ('ago', '前'),
-    ]
-
-    translated = text
-    # Sort translations by length of the English phrase (descending) to match longest first
-    translations.sort(key=lambda x: len(x[0]), reverse=True)
-
-    for en, ja in translations:
-        # Use regex to replace whole words or specific phrases
-        pattern = re.compile(re.escape(en), re.IGNORECASE)
-        translated = pattern.sub(ja, translated)
-
-    return translated
+    return TRANSLATION_PATTERN.sub(lambda m: TRANSLATION_LOOKUP[m.group(0).lower()], text)
 
 def parse_relative_date(relative_text):
     """Convert relative date like '1 week ago' to a stable date."""
@@ -198,13 +209,13 @@ def fetch_ollama_models():
     """Fetch and parse models from Ollama search page."""
     url = "https://ollama.com/search?sort=newest"
     try:
-        response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
+        response = SESSION.get(url, headers={"User-Agent": "Mozilla/5.0"})
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         print(f"Error fetching Ollama search: {e}")
         return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.content, "lxml")
     articles = []
 
     # Find model items - they are in <a> tags with library path
@@ -286,10 +297,10 @@ def main():
 
     rss = generate_rss(articles)
     ET.indent(rss, space="  ", level=0)
-    xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(rss, encoding="unicode")
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(xml_str)
+    # Serialize straight into the file, then swap it in so a failed write never leaves a partial feed
+    tmp_path = output_path + ".tmp"
+    ET.ElementTree(rss).write(tmp_path, encoding="utf-8", xml_declaration=True)
+    os.replace(tmp_path, output_path)
 
     print(f"RSS feed generated: {output_path}")
 
@@ -5,25 +5,85 @@ Leverages structured HTML format for efficient extraction.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
 import xml.etree.ElementTree as ET
 from datetime import datetime
 import os
-import sys
-from urllib.parse import urljoin
 import time
 import re
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+import json
+from functools import lru_cache
+# selenium and webdriver_manager are imported inside the Selenium fallback functions,
+# so runs served by the requests path never pay for loading them
+
+# One page request per run with browser-like headers; a failure falls back to Selenium, so retry only briefly.
+# Accept-Encoding is left to requests/urllib3, which advertise br only when brotli is installed
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=1,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+))
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0',
+})
+
+# Release notes page body and its ETag/Last-Modified validators from the previous run
+PAGE_CACHE_PATH = '.cache/openai-release-notes-page.json'
+
+# Month names as they appear in the release notes date headers
+FULL_MONTHS = [
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+]
+
+# Lowercased full and abbreviated month names -> month number
+MONTHS = {name.lower(): i for i, name in enumerate(FULL_MONTHS, 1)}
+MONTHS.update({name[:3].lower(): i for i, name in enumerate(FULL_MONTHS, 1)})
+
+# Every supported release-note date form in one pattern:
+# "June 24, 2025" / "Jun 24, 2025", "06/24/2025" and "2025-06-24"
+OPENAI_DATE_RE = re.compile(
+    r'([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})'
+    r'|(\d{1,2})/(\d{1,2})/(\d{4})'
+    r'|(\d{4})-(\d{1,2})-(\d{1,2})'
+)
+
+# Date headers are recognised by containing a four-digit year
+YEAR_RE = re.compile(r'\d{4}')
+
+# A feature description keeps at most this many p/li parts, cut to this many characters
+DESCRIPTION_MAX_PARTS = 3
+DESCRIPTION_MAX_LENGTH = 300
+
+@lru_cache(maxsize=None)
+def get_chromedriver_path():
+    """Resolve the chromedriver binary once per process."""
+    # Use a preinstalled driver when CHROMEDRIVER_PATH is set, which skips
+    # ChromeDriverManager's version lookup over the network entirely
+    driver_path = os.environ.get('CHROMEDRIVER_PATH')
+    if driver_path:
+        return driver_path
+    
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
 
 def setup_driver():
     """Setup Chrome driver with appropriate options for both local and CI environments."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    
     chrome_options = Options()
     chrome_options.add_argument('--headless')
     chrome_options.add_argument('--no-sandbox')
@@ -42,10 +102,14 @@ def setup_driver():
     # CI環境での追加設定
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
+    # Images and notifications are never needed for scraping, so don't download them
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2
+    })
     
     try:
-        # Try to use ChromeDriverManager for automatic driver management
-        service = Service(ChromeDriverManager().install())
+        service = Service(get_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=chrome_options)
     except Exception as e:
         print(f"Failed to setup Chrome driver with ChromeDriverManager: {e}")
@@ -68,20 +132,20 @@ def parse_openai_date(date_text):
         # Clean up the date text
         date_text = date_text.strip()
         
-        # Try different date formats
-        date_formats = [
-            '%B %d, %Y',    # June 24, 2025
-            '%b %d, %Y',    # Jun 24, 2025
-            '%m/%d/%Y',     # 06/24/2025
-            '%Y-%m-%d'      # 2025-06-24
-        ]
-        
-        for fmt in date_formats:
+        # One regex match instead of trying strptime formats and catching ValueError
+        match = OPENAI_DATE_RE.fullmatch(date_text)
+        if match:
+            month_name, day, year, us_month, us_day, us_year, iso_year, iso_month, iso_day = match.groups()
             try:
-                dt = datetime.strptime(date_text, fmt)
+                if month_name is not None:
+                    dt = datetime(int(year), MONTHS[month_name.lower()], int(day))
+                elif us_year is not None:
+                    dt = datetime(int(us_year), int(us_month), int(us_day))
+                else:
+                    dt = datetime(int(iso_year), int(iso_month), int(iso_day))
                 return dt.strftime('%d %b %Y %H:%M:%S +0000')
-            except ValueError:
-                continue
+            except (KeyError, ValueError):
+                pass
         
         # If parsing fails, return current date
         print(f"Failed to parse date: {date_text}")
@@ -91,84 +155,103 @@ def parse_openai_date(date_text):
         print(f"Error parsing date '{date_text}': {e}")
         return datetime.now().strftime('%d %b %Y %H:%M:%S +0000')
 
-def extract_openai_articles(page_source, base_url):
+# The first <div class="prose">, matched as a whole class token like BeautifulSoup's class_
+PROSE_XPATH = '(//div[contains(concat(" ", normalize-space(@class), " "), " prose ")])[1]'
+
+def parse_html(page_source):
+    """Parse page HTML with lxml; an empty page becomes an empty document instead of raising."""
+    if not page_source or not page_source.strip():
+        page_source = '<html></html>'
+    return lxml.html.fromstring(page_source)
+
+def extract_openai_articles(page_source, base_url, max_articles=20):
     """Extract articles from OpenAI ChatGPT release notes HTML structure."""
-    soup = BeautifulSoup(page_source, 'html.parser')
+    return extract_openai_articles_from_tree(parse_html(page_source), base_url, max_articles)
+
+def extract_openai_articles_from_tree(tree, base_url, max_articles=20):
+    """Extract articles from an already parsed OpenAI ChatGPT release notes page."""
     articles = []
     
     # Find the main content area
-    content_area = soup.find('div', class_='prose')
-    if not content_area:
+    prose = tree.xpath(PROSE_XPATH)
+    if not prose:
         print("Could not find content area")
         return articles
     
-    # Find all date headers (h1 tags with dates)
-    date_headers = content_area.find_all('h1')
+    # Date headers may sit at any depth inside the content area (e.g. wrapped in a <section>).
+    # Walk each dated h1's following siblings once: h2 starts a feature, p/ul siblings up to
+    # the next header form its description, and the next h1 ends the date section
+    sections = []
     
-    for date_header in date_headers:
-        date_text = date_header.get_text(strip=True)
+    for date_header in prose[0].iterdescendants('h1'):
+        # Features are listed newest first, so everything past the limit would be dropped anyway
+        if len(sections) >= max_articles:
+            break
+        
+        date_text = date_header.text_content().strip()
         
         # Skip if this doesn't look like a date
-        if not re.search(r'\d{4}', date_text):
+        if not YEAR_RE.search(date_text):
             continue
         
-        # Parse the date
         pub_date = parse_openai_date(date_text)
+        description_parts = None
+        description_len = 0
         
-        # Find all h2 headers (feature updates) between this date and the next date
-        current_element = date_header.find_next_sibling()
-        feature_sections = []
-        
-        while current_element:
-            if current_element.name == 'h1':
+        for element in date_header.itersiblings():
+            if element.tag == 'h1':
                 # Reached next date section, stop
                 break
-            elif current_element.name == 'h2':
-                feature_sections.append(current_element)
-            current_element = current_element.find_next_sibling()
-        
-        # Process each feature section
-        for feature_header in feature_sections:
-            feature_title = feature_header.get_text(strip=True)
-            
-            # Extract description from following paragraphs
-            description_parts = []
-            current_element = feature_header.find_next_sibling()
             
-            while current_element and current_element.name not in ['h1', 'h2']:
-                if current_element.name == 'p':
-                    text = current_element.get_text(strip=True)
-                    if text and text != '':
-                        description_parts.append(text)
-                elif current_element.name == 'ul':
-                    # Extract key points from lists
-                    list_items = current_element.find_all('li')
-                    for li in list_items[:2]:  # Limit to first 2 items
-                        text = li.get_text(strip=True)
-                        if text:
-                            description_parts.append(f"• {text}")
-                current_element = current_element.find_next_sibling()
+            elif element.tag == 'h2':
+                if len(sections) >= max_articles:
+                    break
+                description_parts = []
+                description_len = 0
+                sections.append((date_text, pub_date, element.text_content().strip(), description_parts))
             
-            # Build description
-            description = ' '.join(description_parts[:3])  # Limit to first 3 parts
-            if len(description) > 300:
-                description = description[:300] + "..."
-            elif not description:
-                description = "詳細については、リンク先をご確認ください。"
-            
-            # Apply translation
-            title_ja = translate_simple(f"{date_text}: {feature_title}")
-            description_ja = translate_simple(description)
+            # Stop collecting once the description is full; later parts would be cut off anyway
+            elif (description_parts is None
+                  or len(description_parts) >= DESCRIPTION_MAX_PARTS
+                  or description_len > DESCRIPTION_MAX_LENGTH):
+                continue
             
-            # Create article link (use the specific release notes URL)
-            article_link = base_url
+            elif element.tag == 'p':
+                text = element.text_content().strip()
+                if text:
+                    description_parts.append(text)
+                    description_len += len(text)
             
-            articles.append({
-                'title': title_ja,
-                'link': article_link,
-                'description': description_ja,
-                'pubDate': pub_date
-            })
+            elif element.tag == 'ul':
+                # Extract key points from lists
+                for li in element.xpath('(.//li)[position() <= 2]'):  # Limit to first 2 items
+                    text = li.text_content().strip()
+                    if text and len(description_parts) < DESCRIPTION_MAX_PARTS:
+                        description_parts.append(f"• {text}")
+                        description_len += len(text) + 2
+    
+    # Process each feature section
+    for date_text, pub_date, feature_title, description_parts in sections:
+        # Build description
+        description = ' '.join(description_parts)
+        if len(description) > DESCRIPTION_MAX_LENGTH:
+            description = description[:DESCRIPTION_MAX_LENGTH] + "..."
+        elif not description:
+            description = "詳細については、リンク先をご確認ください。"
+        
+        # Apply translation
+        title_ja = translate_simple(f"{date_text}: {feature_title}")
+        description_ja = translate_simple(description)
+        
+        # Create article link (use the specific release notes URL)
+        article_link = base_url
+        
+        articles.append({
+            'title': title_ja,
+            'link': article_link,
+            'description': description_ja,
+            'pubDate': pub_date
+        })
     
     return articles
 
@@ -212,47 +295,89 @@ def get_static_backup_articles():
     
     return backup_articles
 
-def scrape_with_requests_fallback(url):
-    """Try scraping with requests as fallback when Selenium fails."""
-    print("Attempting requests-based fallback...")
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Cache-Control': 'max-age=0',
-    }
+def load_page_cache(cache_path):
+    """Load the cached page body and its validators from a previous run."""
+    if not os.path.exists(cache_path):
+        return {}
+    
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not load page cache: {e}")
+        return {}
+
+def save_page_cache(cache_path, cache):
+    """Save the page body and its validators for the next run."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"Warning: Could not save page cache: {e}")
+
+def scrape_with_requests(url, cache_path=PAGE_CACHE_PATH):
+    """Scrape the release notes with a plain HTTP request, without a browser."""
+    print("Attempting requests-based scraping...")
+    
+    # Browser-like headers live on SESSION; only the cache validators vary per request
+    headers = {}
+    
+    # Revalidate the copy from the previous run so an unchanged page comes back as 304
+    cache = load_page_cache(cache_path)
+    if cache.get('url') == url and cache.get('body'):
+        if cache.get('etag'):
+            headers['If-None-Match'] = cache['etag']
+        if cache.get('last_modified'):
+            headers['If-Modified-Since'] = cache['last_modified']
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SESSION.get(url, headers=headers, timeout=30)
         response.raise_for_status()
         
-        print(f"Requests fallback - Status: {response.status_code}")
-        print(f"Requests fallback - Content length: {len(response.text)}")
+        print(f"Requests - Status: {response.status_code}")
+        
+        if response.status_code == 304 and cache.get('body'):
+            print("Requests - Page not modified since last run, using cached copy")
+            return extract_openai_articles(cache['body'], url)
+        
+        page_source = response.text
+        print(f"Requests - Content length: {len(page_source)}")
         
         # Check for error indicators
-        if "Something went wrong" in response.text or "Access denied" in response.text:
-            print("Requests fallback also blocked")
+        if "Something went wrong" in page_source or "Access denied" in page_source:
+            print("Requests blocked by bot detection")
             return []
         
-        return extract_openai_articles(response.text, url)
+        # Without the prose container the page was not server-rendered, so let Selenium try
+        tree = parse_html(page_source)
+        prose = tree.xpath(PROSE_XPATH)
+        if not prose or len(prose[0]) == 0:
+            print("Requests - No prose content in response")
+            return []
+        
+        # Only a usable page is cached, so a 304 never revalidates a blocked response
+        save_page_cache(cache_path, {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body': page_source
+        })
+        
+        return extract_openai_articles_from_tree(tree, url)
         
     except Exception as e:
-        print(f"Requests fallback failed: {e}")
+        print(f"Requests scraping failed: {e}")
         return []
 
-def scrape_openai_releases():
-    """Scrape OpenAI ChatGPT release notes page."""
-    url = "https://help.openai.com/en/articles/6825453-chatgpt-release-notes"
-    driver = None
+def scrape_with_selenium(url):
+    """Scrape the release notes with headless Chrome, for when the plain request is not enough."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
     
+    driver = None
     try:
         print("Setting up Chrome driver...")
         driver = setup_driver()
@@ -272,9 +397,6 @@ def scrape_openai_releases():
                 
                 driver.get(url)
                 print(f"Page load attempt {attempt + 1} completed")
-                
-                # ページロード後に少し待機
-                time.sleep(2)
                 break
             except Exception as e:
                 print(f"Page load attempt {attempt + 1} failed: {e}")
@@ -300,9 +422,6 @@ def scrape_openai_releases():
             except TimeoutException:
                 print("Still no content found, proceeding with current state...")
         
-        # Add additional wait to ensure content is fully loaded
-        time.sleep(8)
-        
         # Check if we got any content
         page_length = len(driver.page_source)
         print(f"Page source length: {page_length} characters")
@@ -310,33 +429,57 @@ def scrape_openai_releases():
         # Extract articles from HTML structure
         print("Extracting articles from page content...")
         
+        # ページは一度だけ解析し、デバッグ出力・エラー検出・記事抽出で共有する
+        tree = parse_html(driver.page_source)
+        
         # デバッグ: ページの一部を出力
-        soup_debug = BeautifulSoup(driver.page_source, 'html.parser')
-        h1_tags = soup_debug.find_all('h1')
-        h2_tags = soup_debug.find_all('h2')
-        prose_divs = soup_debug.find_all('div', class_='prose')
+        h1_tags = tree.xpath('//h1')
+        h2_tags = tree.xpath('//h2')
+        prose_divs = tree.xpath('//div[contains(concat(" ", normalize-space(@class), " "), " prose ")]')
         
         print(f"Debug info - H1 tags found: {len(h1_tags)}")
         print(f"Debug info - H2 tags found: {len(h2_tags)}")
         print(f"Debug info - Prose divs found: {len(prose_divs)}")
         
         if h1_tags:
-            print(f"First H1 content: {h1_tags[0].get_text(strip=True)[:100]}")
+            print(f"First H1 content: {h1_tags[0].text_content().strip()[:100]}")
         if h2_tags:
-            print(f"First H2 content: {h2_tags[0].get_text(strip=True)[:100]}")
+            print(f"First H2 content: {h2_tags[0].text_content().strip()[:100]}")
         
         # Check for actual error indicators more carefully
-        soup_check = BeautifulSoup(driver.page_source, 'html.parser')
-        error_h1 = soup_check.find('h1')
+        error_h1 = h1_tags[0] if h1_tags else None
         
-        if (error_h1 and 
-            ("Something went wrong" in error_h1.get_text() or 
-             "Access denied" in error_h1.get_text()) and 
+        if (error_h1 is not None and 
+            ("Something went wrong" in error_h1.text_content() or 
+             "Access denied" in error_h1.text_content()) and 
             len(prose_divs) == 0):
-            print("Bot detection detected! Trying requests fallback...")
-            articles = scrape_with_requests_fallback(url)
+            # The requests path has already been tried at this point
+            print("Bot detection detected!")
+            articles = []
         else:
-            articles = extract_openai_articles(driver.page_source, url)
+            articles = extract_openai_articles_from_tree(tree, url)
+        
+        return articles
+    
+    finally:
+        if driver:
+            driver.quit()
+
+def scrape_openai_releases():
+    """Scrape OpenAI ChatGPT release notes page, using Selenium only when requests is not enough."""
+    url = "https://help.openai.com/en/articles/6825453-chatgpt-release-notes"
+    
+    # The help page is server-rendered, so a plain request is usually enough.
+    # USE_SELENIUM=1 forces the browser path (e.g. for debugging bot detection in CI)
+    if os.environ.get('USE_SELENIUM') != '1':
+        articles = scrape_with_requests(url)
+        if articles:
+            print(f"Successfully extracted {len(articles)} articles without a browser")
+            return articles[:20]  # Limit to 20 articles
+        print("No articles found with requests, falling back to Selenium...")
+    
+    try:
+        articles = scrape_with_selenium(url)
         
         # If no articles found, try static backup data
         if not articles:
@@ -369,52 +512,54 @@ def scrape_openai_releases():
             'description': 'リリースノートの取得中にエラーが発生しました。最新情報については OpenAI 公式サイトをご確認ください。',
             'pubDate': datetime.now().strftime('%d %b %Y %H:%M:%S +0000')
         }]
-    
-    finally:
-        if driver:
-            driver.quit()
 
+TRANSLATIONS = [
+    ('release notes', 'リリースノート'),
+    ('artificial intelligence', '人工知能'),
+    ('machine learning', '機械学習'),
+    ('announcement', '発表'),
+    ('research', '研究'),
+    ('release', 'リリース'),
+    ('update', 'アップデート'),
+    ('improvement', '改善'),
+    ('enhancement', '強化'),
+    ('feature', '機能'),
+    ('capability', '機能'),
+    ('performance', 'パフォーマンス'),
+    ('quality', '品質'),
+    ('experience', '体験'),
+    ('interface', 'インターフェース'),
+    ('support', 'サポート'),
+    ('available', '利用可能'),
+    ('users', 'ユーザー'),
+    ('model', 'モデル'),
+    ('version', 'バージョン'),
+    ('beta', 'ベータ'),
+    ('latest', '最新'),
+    ('news', 'ニュース'),
+    ('blog', 'ブログ'),
+    ('post', '投稿'),
+    ('new', '新しい')
+]
+
+# 長い単語から順に並べて部分一致の問題を回避（"release notes"は"release"より先に一致する）。
+# 全キーワードを1つのパターンにまとめ、テキストを1回の走査で置換する。置換後の文字列が
+# 別のキーワードに再度一致することもない
+TRANSLATION_LOOKUP = dict(TRANSLATIONS)
+TRANSLATION_PATTERN = re.compile(
+    '|'.join(re.escape(en) for en in sorted(TRANSLATION_LOOKUP, key=len, reverse=True))
+)
+
+# Every keyword contains ASCII letters, so text without any (e.g. already Japanese) needs no scan
+ASCII_LETTER_RE = re.compile(r'[A-Za-z]')
+
+@lru_cache(maxsize=1024)
 def translate_simple(text):
     """Simple translation using keyword replacement."""
-    # 長い単語から順に置換して部分一致の問題を回避
-    translations = [
-        ('release notes', 'リリースノート'),
-        ('artificial intelligence', '人工知能'),
-        ('machine learning', '機械学習'),
-        ('announcement', '発表'),
-        ('research', '研究'),
-        ('release', 'リリース'),
-        ('update', 'アップデート'),
-        ('improvement', '改善'),
-        ('enhancement', '強化'),
-        ('feature', '機能'),
-        ('capability', '機能'),
-        ('performance', 'パフォーマンス'),
-        ('quality', '品質'),
-        ('experience', '体験'),
-        ('interface', 'インターフェース'),
-        ('support', 'サポート'),
-        ('available', '利用可能'),
-        ('users', 'ユーザー'),
-        ('model', 'モデル'),
-        ('version', 'バージョン'),
-        ('beta', 'ベータ'),
-        ('latest', '最新'),
-        ('news', 'ニュース'),
-        ('blog', 'ブログ'),
-        ('post', '投稿'),
-        ('new', '新しい'),
-        ('ChatGPT', 'ChatGPT'),
-        ('OpenAI', 'OpenAI'),
-        ('GPT-4', 'GPT-4'),
-        ('AI', 'AI')
-    ]
-    
-    translated = text
-    for en, ja in translations:
-        translated = translated.replace(en, ja)
+    if not ASCII_LETTER_RE.search(text):
+        return text
     
-    return translated
+    return TRANSLATION_PATTERN.sub(lambda m: TRANSLATION_LOOKUP[m.group(0)], text)
 
 def generate_rss_feed(articles):
     """Generate RSS 2.0 XML feed from articles."""
@@ -471,14 +616,15 @@ def main():
     print("Generating RSS feed...")
     rss_element = generate_rss_feed(articles)
     
-    # Create XML string with proper formatting
-    ET.indent(rss_element, space="  ", level=0)
-    xml_str = '<?xml version="1.0" encoding="UTF-8"?>\n' + ET.tostring(rss_element, encoding='unicode')
+    # Feed readers ignore whitespace, so indentation is only added on request (RSS_PRETTY=1)
+    if os.environ.get('RSS_PRETTY'):
+        ET.indent(rss_element, space="  ", level=0)
     
-    # Write to file
+    # Write to a temporary file and rename it into place, so readers never see a partial feed
     output_path = 'dist/openai-releases.xml'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(xml_str)
+    tmp_path = output_path + '.tmp'
+    ET.ElementTree(rss_element).write(tmp_path, encoding='utf-8', xml_declaration=True)
+    os.replace(tmp_path, output_path)
     
     print(f"RSS feed generated successfully: {output_path}")
     
@@ -4,21 +4,22 @@
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock, call
-import sys
+from unittest.mock import Mock, patch
 import os
 import json
-
-# プロジェクトルートをパスに追加
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+import requests
 
 from scripts.generate_anthropic_rss import (
     setup_driver,
+    get_chromedriver_path,
     extract_articles_from_json,
     scrape_anthropic_news,
+    parse_articles,
+    fetch_page_source,
     extract_article_from_object,
     find_articles_in_json,
     extract_articles_from_dom,
+    extract_articles_from_links,
     load_existing_articles,
     merge_articles_with_existing,
     create_article_key,
@@ -26,9 +27,133 @@ from scripts.generate_anthropic_rss import (
 )
 
 
+# テスト用HTMLはモジュール読み込み時に一度だけ生成し、各テストで共有する
+HTML_APPLICATION_JSON = """
+<html>
+    <head>
+        <script type="application/json" id="data">
+        {
+            "articles": [
+                {
+                    "title": "Test Article 1",
+                    "slug": {"current": "/news/test-1"},
+                    "publishedOn": "2023-12-25T10:30:00Z"
+                },
+                {
+                    "title": "Test Article 2",
+                    "slug": {"current": "/news/test-2"},
+                    "publishedOn": "2023-12-24T10:30:00Z"
+                }
+            ]
+        }
+        </script>
+    </head>
+</html>
+"""
+
+HTML_NEXT_DATA = """
+<html>
+    <head>
+        <script id="__NEXT_DATA__" type="application/json">
+        {
+            "props": {
+                "pageProps": {
+                    "posts": [
+                        {
+                            "title": "Next.js Article",
+                            "slug": {"current": "/news/nextjs-article"},
+                            "publishedOn": "2023-12-23T10:30:00Z"
+                        }
+                    ]
+                }
+            }
+        }
+        </script>
+    </head>
+</html>
+"""
+
+HTML_INVALID_JSON = """
+<html>
+    <head>
+        <script type="application/json">
+        { invalid json content }
+        </script>
+        <script type="application/json">
+        {
+            "validData": {
+                "title": "Valid Article",
+                "slug": {"current": "/news/valid"},
+                "publishedOn": "2023-12-22T10:30:00Z"
+            }
+        }
+        </script>
+    </head>
+</html>
+"""
+
+HTML_NO_JSON_SCRIPTS = """
+<html>
+    <head>
+        <script type="text/javascript">
+        console.log("This is not JSON");
+        </script>
+    </head>
+</html>
+"""
+
+HTML_NEWS_LINKS = """
+<html>
+    <body>
+        <a href="/news/claude-4-announcement">Introducing Claude 4</a>
+        <a href="/news/anthropic-funding">Anthropic raises funding</a>
+        <a href="/about">About us</a>
+        <a href="/news/ai-safety">AI Safety research</a>
+    </body>
+</html>
+"""
+
+HTML_DUPLICATE_LINKS = """
+<html>
+    <body>
+        <a href="/news/same-article">Same Article Title</a>
+        <a href="/news/same-article">Same Article Title</a>
+        <a href="/news/different-article">Different Article</a>
+    </body>
+</html>
+"""
+
+# 上限（15件）を超える20記事分のJSONを埋め込んだHTML
+HTML_MANY_ARTICLES = '<html><head><script type="application/json">{"articles": [%s]}</script></head></html>' % ",".join(
+    f'{{"title": "Article {i}", "slug": {{"current": "/news/article-{i}"}}, "publishedOn": "2023-12-01T10:30:00Z"}}'
+    for i in range(20)
+)
+
+
 class TestSetupDriver:
     """setup_driver関数のテスト"""
     
+    @pytest.fixture(autouse=True)
+    def clear_chromedriver_path_cache(self):
+        """テストごとにドライバーパスのキャッシュをクリアする"""
+        get_chromedriver_path.cache_clear()
+        yield
+        get_chromedriver_path.cache_clear()
+    
+    @patch('scripts.generate_anthropic_rss.ChromeDriverManager')
+    @patch('scripts.generate_anthropic_rss.webdriver.Chrome')
+    @patch('scripts.generate_anthropic_rss.Service')
+    def test_driver_path_resolved_once(self, mock_service, mock_chrome, mock_manager):
+        """ChromeDriverManagerによるパス解決がプロセス内で一度だけ行われることのテスト"""
+        mock_manager().install.return_value = "/path/to/chromedriver"
+        mock_manager.reset_mock()
+        
+        setup_driver()
+        setup_driver()
+        
+        mock_manager.assert_called_once()
+        assert mock_service.call_count == 2
+    
     @patch('scripts.generate_anthropic_rss.ChromeDriverManager')
     @patch('scripts.generate_anthropic_rss.webdriver.Chrome')
     @patch('scripts.generate_anthropic_rss.Service')
@@ -48,6 +173,21 @@ class TestSetupDriver:
         
         assert result == mock_driver
     
+    @patch.dict(os.environ, {'CHROMEDRIVER_PATH': '/usr/bin/chromedriver'})
+    @patch('scripts.generate_anthropic_rss.ChromeDriverManager')
+    @patch('scripts.generate_anthropic_rss.webdriver.Chrome')
+    @patch('scripts.generate_anthropic_rss.Service')
+    def test_chromedriver_path_env_skips_manager(self, mock_service, mock_chrome, mock_manager):
+        """CHROMEDRIVER_PATHが設定されている場合にChromeDriverManagerを使わないことのテスト"""
+        mock_driver = Mock()
+        mock_chrome.return_value = mock_driver
+        
+        result = setup_driver()
+        
+        mock_manager.assert_not_called()
+        mock_service.assert_called_once_with('/usr/bin/chromedriver')
+        assert result == mock_driver
+    
     @patch('scripts.generate_anthropic_rss.ChromeDriverManager')
     @patch('scripts.generate_anthropic_rss.webdriver.Chrome')
     def test_fallback_to_system_chrome(self, mock_chrome, mock_manager):
@@ -75,10 +215,8 @@ class TestSetupDriver:
         mock_manager().install.side_effect = Exception("ChromeDriverManager failed")
         mock_chrome.side_effect = Exception("Chrome setup failed")
         
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception, match="Chrome setup failed"):
             setup_driver()
-        
-        assert "Chrome setup failed" in str(exc_info.value)
 
 
 class TestExtractArticlesFromJson:
@@ -86,30 +224,7 @@ class TestExtractArticlesFromJson:
     
     def test_extract_from_application_json_script(self):
         """application/jsonスクリプトタグからの記事抽出テスト"""
-        html_content = """
-        <html>
-            <head>
-                <script type="application/json" id="data">
-                {
-                    "articles": [
-                        {
-                            "title": "Test Article 1",
-                            "slug": {"current": "/news/test-1"},
-                            "publishedOn": "2023-12-25T10:30:00Z"
-                        },
-                        {
-                            "title": "Test Article 2",
-                            "slug": {"current": "/news/test-2"},
-                            "publishedOn": "2023-12-24T10:30:00Z"
-                        }
-                    ]
-                }
-                </script>
-            </head>
-        </html>
-        """
-        
-        articles = extract_articles_from_json(html_content)
+        articles = extract_articles_from_json(HTML_APPLICATION_JSON)
         
         assert len(articles) == 2
         titles = [article['title'] for article in articles]
@@ -118,29 +233,7 @@ class TestExtractArticlesFromJson:
     
     def test_extract_from_next_data_script(self):
         """__NEXT_DATA__スクリプトからの記事抽出テスト"""
-        html_content = """
-        <html>
-            <head>
-                <script id="__NEXT_DATA__" type="application/json">
-                {
-                    "props": {
-                        "pageProps": {
-                            "posts": [
-                                {
-                                    "title": "Next.js Article",
-                                    "slug": {"current": "/news/nextjs-article"},
-                                    "publishedOn": "2023-12-23T10:30:00Z"
-                                }
-                            ]
-                        }
-                    }
-                }
-                </script>
-            </head>
-        </html>
-        """
-        
-        articles = extract_articles_from_json(html_content)
+        articles = extract_articles_from_json(HTML_NEXT_DATA)
         
         # 重複を考慮して1つ以上あることを確認
         assert len(articles) >= 1
@@ -150,44 +243,23 @@ class TestExtractArticlesFromJson:
     
     def test_invalid_json_handling(self):
         """無効なJSONの処理テスト"""
-        html_content = """
-        <html>
-            <head>
-                <script type="application/json">
-                { invalid json content }
-                </script>
-                <script type="application/json">
-                {
-                    "validData": {
-                        "title": "Valid Article",
-                        "slug": {"current": "/news/valid"},
-                        "publishedOn": "2023-12-22T10:30:00Z"
-                    }
-                }
-                </script>
-            </head>
-        </html>
-        """
-        
-        articles = extract_articles_from_json(html_content)
+        articles = extract_articles_from_json(HTML_INVALID_JSON)
         
         # 無効なJSONは無視され、有効なものだけが処理される
         assert len(articles) == 1
         assert 'Valid Article' in articles[0]['title']
-    
+
+    def test_stops_at_max_articles(self):
+        """上限件数に達したら抽出を打ち切ることのテスト"""
+        articles = extract_articles_from_json(HTML_MANY_ARTICLES)
+
+        assert len(articles) == 15
+        assert 'Article 0' in articles[0]['title']
+        assert 'Article 14' in articles[-1]['title']
+
     def test_no_json_scripts(self):
         """JSONスクリプトが存在しない場合のテスト"""
-        html_content = """
-        <html>
-            <head>
-                <script type="text/javascript">
-                console.log("This is not JSON");
-                </script>
-            </head>
-        </html>
-        """
-        
-        articles = extract_articles_from_json(html_content)
+        articles = extract_articles_from_json(HTML_NO_JSON_SCRIPTS)
         assert len(articles) == 0
 
 
@@ -211,23 +283,12 @@ class TestExtractArticleFromObject:
         assert '25 Dec 2023' in result['pubDate']
         assert 'test article' in result['description'].lower()
     
-    def test_missing_title(self):
-        """タイトルが欠如している場合のテスト"""
-        obj = {
-            'slug': {'current': '/news/test'},
-            'publishedOn': '2023-12-25T10:30:00Z'
-        }
-        
-        result = extract_article_from_object(obj)
-        assert result is None
-    
-    def test_missing_slug(self):
-        """スラッグが欠如している場合のテスト"""
-        obj = {
-            'title': 'Test Article',
-            'publishedOn': '2023-12-25T10:30:00Z'
-        }
-        
+    @pytest.mark.parametrize("obj", [
+        {'slug': {'current': '/news/test'}, 'publishedOn': '2023-12-25T10:30:00Z'},
+        {'title': 'Test Article', 'publishedOn': '2023-12-25T10:30:00Z'},
+    ], ids=['missing_title', 'missing_slug'])
+    def test_missing_required_field(self, obj):
+        """タイトルまたはスラッグが欠如している場合のテスト"""
         result = extract_article_from_object(obj)
         assert result is None
     
@@ -311,55 +372,48 @@ class TestFindArticlesInJson:
         articles = find_articles_in_json(data)
         assert len(articles) == 0
 
+    def test_deeply_nested_structure(self):
+        """再帰上限を超える深さのネストでも記事が見つかることのテスト"""
+        data = {
+            'title': 'Deep Article',
+            'slug': {'current': '/news/deep'},
+            'publishedOn': '2023-12-25T10:30:00Z'
+        }
+        for _ in range(2000):
+            data = {'children': [data]}
+
+        articles = find_articles_in_json(data)
+
+        assert len(articles) == 1
+        assert 'Deep Article' in articles[0]['title']
+
 
 class TestExtractArticlesFromDom:
-    """extract_articles_from_dom関数のテスト"""
+    """extract_articles_from_dom・extract_articles_from_links関数のテスト"""
     
-    def test_news_links_extraction(self):
+    def test_news_links_extraction(self, parsed_news_links):
         """ニュースリンクの抽出テスト"""
-        html_content = """
-        <html>
-            <body>
-                <a href="/news/claude-4-announcement">Introducing Claude 4</a>
-                <a href="/news/anthropic-funding">Anthropic raises funding</a>
-                <a href="/about">About us</a>
-                <a href="/news/ai-safety">AI Safety research</a>
-            </body>
-        </html>
-        """
-        
-        articles = extract_articles_from_dom(html_content, "https://www.anthropic.com/news")
+        articles = extract_articles_from_links(parsed_news_links(HTML_NEWS_LINKS), "https://www.anthropic.com/news")
         
         assert len(articles) >= 3  # 3つのニュースリンクが見つかるはず
         
-        links = [article['link'] for article in articles]
-        assert any('/news/claude-4-announcement' in link for link in links)
-        assert any('/news/anthropic-funding' in link for link in links)
-        assert any('/news/ai-safety' in link for link in links)
-        
-        # About usリンクは含まれていないことを確認
-        assert not any('/about' in link for link in links)
-    
-    def test_duplicate_removal(self):
+        # 記事を一度だけ走査し、見つかったニュースパスを集める
+        expected_paths = {'/news/claude-4-announcement', '/news/anthropic-funding', '/news/ai-safety'}
+        found_paths = set()
+        for article in articles:
+            link = article['link']
+            # About usリンクは含まれていないことを確認
+            assert '/about' not in link
+            found_paths.update(path for path in expected_paths if path in link)
+        assert found_paths == expected_paths
+    
+    def test_duplicate_removal(self, parsed_news_links):
         """重複記事の除去テスト"""
-        html_content = """
-        <html>
-            <body>
-                <a href="/news/same-article">Same Article Title</a>
-                <a href="/news/same-article">Same Article Title</a>
-                <a href="/news/different-article">Different Article</a>
-            </body>
-        </html>
-        """
-        
-        articles = extract_articles_from_dom(html_content, "https://www.anthropic.com/news")
+        articles = extract_articles_from_links(parsed_news_links(HTML_DUPLICATE_LINKS), "https://www.anthropic.com/news")
         
-        # 重複が除去されて2記事になるはず
-        assert len(articles) == 2
-        
-        links = [article['link'] for article in articles]
-        unique_links = set(links)
-        assert len(unique_links) == 2
+        # 重複が除去されて、リンクの異なる2記事になるはず
+        unique_links = {article['link'] for article in articles}
+        assert len(unique_links) == 2 == len(articles)
     
     def test_empty_html(self):
         """空のHTMLのテスト"""
@@ -370,19 +424,70 @@ class TestExtractArticlesFromDom:
         assert len(articles) == 0
 
 
-class TestScrapeAnthropicNews:
-    """scrape_anthropic_news関数の統合テスト（モック使用）"""
+class TestScrapeAnthropicNewsOverHttp:
+    """scrape_anthropic_news関数のHTTP取得経路のテスト"""
     
     @patch('scripts.generate_anthropic_rss.setup_driver')
     @patch('scripts.generate_anthropic_rss.extract_articles_from_json')
-    @patch('scripts.generate_anthropic_rss.WebDriverWait')
-    @patch('scripts.generate_anthropic_rss.time.sleep')
-    def test_successful_scraping_with_json_extraction(self, mock_sleep, mock_wait, mock_extract_json, mock_setup):
+    @patch('scripts.generate_anthropic_rss.SESSION.get')
+    def test_http_fetch_skips_selenium(self, mock_get, mock_extract_json, mock_setup, tmp_path):
+        """HTTP取得で記事が見つかった場合にSeleniumを起動せず、ページをキャッシュすることのテスト"""
+        cache_path = str(tmp_path / 'page.json')
+        mock_get.return_value = Mock(status_code=200, text="<html>server rendered</html>", headers={'ETag': '"v1"'})
+        mock_extract_json.return_value = [
+            {
+                'title': 'HTTP Article',
+                'link': 'https://www.anthropic.com/news/http',
+                'description': 'HTTP description',
+                'pubDate': '01 Jan 2023 12:00:00 +0000'
+            }
+        ]
+        
+        result = scrape_anthropic_news(cache_path)
+        
+        mock_get.assert_called_once()
+        mock_extract_json.assert_called_once_with("<html>server rendered</html>")
+        mock_setup.assert_not_called()
+        assert len(result) == 1
+        assert result[0]['title'] == 'HTTP Article'
+        
+        with open(cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+        assert cache['etag'] == '"v1"'
+        assert cache['body'] == "<html>server rendered</html>"
+    
+    @patch('scripts.generate_anthropic_rss.fetch_page_source_with_selenium', return_value=HTML_NO_JSON_SCRIPTS)
+    @patch('scripts.generate_anthropic_rss.SESSION.get')
+    def test_page_without_article_json_is_not_cached(self, mock_get, mock_selenium, tmp_path):
+        """記事JSONのないページはSeleniumにフォールバックし、キャッシュに保存されないことのテスト"""
+        cache_path = tmp_path / 'page.json'
+        mock_get.return_value = Mock(status_code=200, text=HTML_NO_JSON_SCRIPTS, headers={'ETag': '"v1"'})
+        
+        scrape_anthropic_news(str(cache_path))
+        
+        mock_selenium.assert_called_once()
+        assert not cache_path.exists()
+
+
+@pytest.mark.selenium
+@pytest.mark.usefixtures("selenium_env")
+class TestScrapeAnthropicNews:
+    """scrape_anthropic_news関数の統合テスト（モック使用）"""
+    
+    @pytest.fixture(autouse=True)
+    def http_fetch_fails(self, mocker):
+        """HTTPでの取得は失敗したものとして扱い、Seleniumの経路をテストする"""
+        mocker.patch('scripts.generate_anthropic_rss.fetch_page_source', return_value=(None, False))
+    
+    def test_successful_scraping_with_json_extraction(self, mocker):
         """JSON抽出による正常なスクレイピングテスト"""
-        # モックドライバーの設定
-        mock_driver = Mock()
+        mock_setup = mocker.patch('scripts.generate_anthropic_rss.setup_driver')
+        mock_extract_json = mocker.patch('scripts.generate_anthropic_rss.extract_articles_from_json')
+        mock_wait = mocker.patch('scripts.generate_anthropic_rss.WebDriverWait')
+        
+        # モックドライバーの設定（WebDriverWaitはモック済みなので、使う属性だけに限定する）
+        mock_driver = Mock(spec_set=['get', 'quit', 'page_source'])
         mock_driver.page_source = "<html>mock content</html>"
-        mock_driver.find_elements.return_value = [Mock()] * 15  # 15個のリンク要素を返す
         mock_setup.return_value = mock_driver
         
         # JSON抽出が成功する場合
@@ -412,49 +517,10 @@ class TestScrapeAnthropicNews:
         assert len(result) == 1
         assert result[0]['title'] == 'Mock Article'
     
-    @patch('scripts.generate_anthropic_rss.setup_driver')
-    @patch('scripts.generate_anthropic_rss.extract_articles_from_json')
-    @patch('scripts.generate_anthropic_rss.extract_articles_from_dom')
-    @patch('scripts.generate_anthropic_rss.WebDriverWait')
-    def test_fallback_to_dom_parsing(self, mock_wait, mock_extract_dom, mock_extract_json, mock_setup):
-        """JSON抽出が失敗した場合のDOM解析フォールバックテスト"""
-        # モックドライバーの設定
-        mock_driver = Mock()
-        mock_driver.page_source = "<html>mock content</html>"
-        mock_driver.find_elements.return_value = [Mock()] * 15
-        mock_setup.return_value = mock_driver
-        
-        # WebDriverWaitのモック設定
-        mock_wait_instance = Mock()
-        mock_wait_instance.until.return_value = True
-        mock_wait.return_value = mock_wait_instance
-        
-        # JSON抽出は失敗、DOM抽出は成功
-        mock_extract_json.return_value = []
-        mock_extract_dom.return_value = [
-            {
-                'title': 'DOM Article',
-                'link': 'https://www.anthropic.com/news/dom',
-                'description': 'DOM description',
-                'pubDate': '01 Jan 2023 12:00:00 +0000'
-            }
-        ]
-        
-        result = scrape_anthropic_news()
-        
-        # 両方の抽出メソッドが呼ばれたことを確認
-        mock_extract_json.assert_called_once()
-        mock_extract_dom.assert_called_once()
-        
-        # DOM抽出の結果が返されることを確認
-        assert len(result) == 1
-        assert result[0]['title'] == 'DOM Article'
-    
-    @patch('scripts.generate_anthropic_rss.setup_driver')
-    def test_driver_setup_failure_handling(self, mock_setup):
+    def test_driver_setup_failure_handling(self, mocker):
         """ドライバー設定失敗時のエラーハンドリングテスト"""
         # ドライバー設定を失敗させる
-        mock_setup.side_effect = Exception("Driver setup failed")
+        mocker.patch('scripts.generate_anthropic_rss.setup_driver', side_effect=Exception("Driver setup failed"))
         
         result = scrape_anthropic_news()
         
@@ -463,26 +529,9 @@ class TestScrapeAnthropicNews:
         assert 'エラー' in result[0]['title']
         assert 'https://www.anthropic.com/news' in result[0]['link']
     
-    @patch('scripts.generate_anthropic_rss.setup_driver')
-    @patch('scripts.generate_anthropic_rss.extract_articles_from_json')
-    @patch('scripts.generate_anthropic_rss.extract_articles_from_dom')
-    @patch('scripts.generate_anthropic_rss.WebDriverWait')
-    def test_no_articles_found_fallback(self, mock_wait, mock_extract_dom, mock_extract_json, mock_setup):
+    def test_no_articles_found_fallback(self, mocker):
         """記事が見つからない場合のフォールバック記事テスト"""
-        # モックドライバーの設定
-        mock_driver = Mock()
-        mock_driver.page_source = "<html>empty content</html>"
-        mock_driver.find_elements.return_value = [Mock()] * 15
-        mock_setup.return_value = mock_driver
-        
-        # WebDriverWaitのモック設定
-        mock_wait_instance = Mock()
-        mock_wait_instance.until.return_value = True
-        mock_wait.return_value = mock_wait_instance
-        
-        # 両方の抽出メソッドが空の結果を返す
-        mock_extract_json.return_value = []
-        mock_extract_dom.return_value = []
+        mocker.patch('scripts.generate_anthropic_rss.fetch_page_source_with_selenium', return_value=HTML_NO_JSON_SCRIPTS)
         
         result = scrape_anthropic_news()
         
@@ -490,41 +539,88 @@ class TestScrapeAnthropicNews:
         assert len(result) == 1
         assert '最新ニュース' in result[0]['title']
         assert 'https://www.anthropic.com/news' in result[0]['link']
+
+
+class TestParseArticles:
+    """parse_articles関数のテスト（ブラウザを使わずHTMLを直接解析）"""
     
-    @patch('scripts.generate_anthropic_rss.setup_driver')
-    @patch('scripts.generate_anthropic_rss.extract_articles_from_json')
-    @patch('scripts.generate_anthropic_rss.WebDriverWait')
-    def test_article_limit_enforcement(self, mock_wait, mock_extract_json, mock_setup):
+    def test_json_extraction(self):
+        """埋め込みJSONから記事が抽出されることのテスト"""
+        articles = parse_articles(HTML_APPLICATION_JSON)
+        
+        assert len(articles) == 2
+        assert 'Test Article 1' in articles[0]['title']
+    
+    def test_fallback_to_dom_parsing(self):
+        """JSONがない場合にDOM解析へフォールバックすることのテスト"""
+        articles = parse_articles(HTML_NEWS_LINKS)
+        
+        assert len(articles) == 3
+        assert any('/news/ai-safety' in article['link'] for article in articles)
+    
+    def test_no_articles_found(self):
+        """記事が見つからない場合に空リストを返すことのテスト"""
+        assert parse_articles(HTML_NO_JSON_SCRIPTS) == []
+    
+    def test_article_limit_enforcement(self):
         """記事数制限の確認テスト"""
-        # モックドライバーの設定
-        mock_driver = Mock()
-        mock_driver.page_source = "<html>mock content</html>"
-        mock_driver.find_elements.return_value = [Mock()] * 15
-        mock_setup.return_value = mock_driver
+        # 制限の15記事を超える20記事を含むHTML
+        result = parse_articles(HTML_MANY_ARTICLES)
         
-        # WebDriverWaitのモック設定
-        mock_wait_instance = Mock()
-        mock_wait_instance.until.return_value = True
-        mock_wait.return_value = mock_wait_instance
+        # 15記事に制限されることを確認
+        assert len(result) == 15
+        assert 'Article 0' in result[0]['title']
+        assert 'Article 14' in result[14]['title']
+    
+    def test_sample_html_fixture(self, sample_html_with_articles, sample_parsed_articles):
+        """共通HTMLサンプルから、埋め込まれた記事JSONどおりの記事が抽出されることのテスト"""
+        expected = sample_parsed_articles['articles'][0]
         
-        # 20記事を生成（制限の15記事を超える）
-        mock_articles = []
-        for i in range(20):
-            mock_articles.append({
-                'title': f'Article {i}',
-                'link': f'https://www.anthropic.com/news/article-{i}',
-                'description': f'Description {i}',
-                'pubDate': '01 Jan 2023 12:00:00 +0000'
-            })
+        articles = parse_articles(sample_html_with_articles)
         
-        mock_extract_json.return_value = mock_articles
+        assert len(articles) == 1
+        assert articles[0]['link'] == 'https://www.anthropic.com' + expected['slug']['current']
+        assert articles[0]['description'] == expected['description']
+
+
+class TestFetchPageSource:
+    """fetch_page_source関数のテスト"""
+    
+    @patch('scripts.generate_anthropic_rss.SESSION.get')
+    def test_returns_page_text(self, mock_get):
+        """正常なレスポンスでHTMLが返され、キャッシュの辞書に記録されることのテスト"""
+        cache = {}
+        mock_get.return_value = Mock(status_code=200, text="<html>page</html>", headers={'ETag': '"v1"'})
+        
+        assert fetch_page_source("https://www.anthropic.com/news", cache) == ("<html>page</html>", False)
+        
+        assert cache['etag'] == '"v1"'
+        assert cache['body'] == "<html>page</html>"
+    
+    @patch('scripts.generate_anthropic_rss.SESSION.get')
+    def test_not_modified_uses_cached_body(self, mock_get):
+        """304応答の場合にキャッシュ済みのHTMLが未更新として返されることのテスト"""
+        cache = {
+            'url': "https://www.anthropic.com/news",
+            'etag': '"v1"',
+            'last_modified': 'Mon, 25 Dec 2023 10:30:00 GMT',
+            'body': "<html>cached</html>"
+        }
+        mock_get.return_value = Mock(status_code=304, text="", headers={})
         
-        result = scrape_anthropic_news()
+        result = fetch_page_source("https://www.anthropic.com/news", cache)
         
-        # 15記事に制限されることを確認
-        assert len(result) == 15
-        assert result[0]['title'] == 'Article 0'
-        assert result[14]['title'] == 'Article 14'
+        assert result == ("<html>cached</html>", True)
+        sent_headers = mock_get.call_args[1]['headers']
+        assert sent_headers['If-None-Match'] == '"v1"'
+        assert sent_headers['If-Modified-Since'] == 'Mon, 25 Dec 2023 10:30:00 GMT'
+    
+    @patch('scripts.generate_anthropic_rss.SESSION.get')
+    def test_request_error_returns_none(self, mock_get):
+        """通信エラー時にHTMLとしてNoneが返されることのテスト"""
+        mock_get.side_effect = requests.exceptions.ConnectionError("network down")
+        
+        assert fetch_page_source("https://www.anthropic.com/news", {}) == (None, False)
 
 
 class TestLoadExistingArticles:
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+ベンチマーク: Anthropicの記事抽出処理の性能回帰を検出する
+"""
+
+import pytest
+
+from scripts.generate_anthropic_rss import (
+    extract_articles_from_json,
+    extract_articles_from_dom
+)
+
+# 通常の実行ではスキップされ、--run-slow を付けたときだけ実行される
+pytestmark = pytest.mark.slow
+
+BASE_URL = "https://www.anthropic.com/news"
+
+# 実ページ程度の規模（記事200件）のNext.jsデータとニュースリンク
+LARGE_JSON_HTML = '<html><head><script id="__NEXT_DATA__" type="application/json">{"props": {"pageProps": {"posts": [%s]}}}</script></head></html>' % ",".join(
+    f'{{"title": "Benchmark Article {i}", "slug": {{"current": "/news/benchmark-{i}"}},'
+    f' "publishedOn": "2023-12-01T10:30:00Z", "summary": "Research news about model safety {i}"}}'
+    for i in range(200)
+)
+
+LARGE_DOM_HTML = "<html><body>%s</body></html>" % "".join(
+    f'<div><a href="/about">About us</a><a href="/news/benchmark-{i}">Benchmark news article {i}</a></div>'
+    for i in range(200)
+)
+
+
+def test_bench_json_extract(benchmark):
+    """埋め込みJSONからの記事抽出のベンチマーク"""
+    articles = benchmark(extract_articles_from_json, LARGE_JSON_HTML)
+    assert len(articles) == 15
+
+
+def test_bench_dom_extract(benchmark):
+    """DOMからの記事抽出のベンチマーク"""
+    articles = benchmark(extract_articles_from_dom, LARGE_DOM_HTML, BASE_URL)
+    assert len(articles) == 10
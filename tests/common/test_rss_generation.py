@@ -4,45 +4,82 @@
 全RSSフィード生成サービスで共有される機能をテスト
 """
 
+import re
 import pytest
 import xml.etree.ElementTree as ET
 from datetime import datetime
-from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
-
-# プロジェクトルートをパスに追加
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from scripts.generate_anthropic_rss import (
     translate_simple,
+    translate_articles,
     format_date,
     generate_rss_feed
 )
+from tests.helpers import assert_valid_rss_structure, item_fields
+
+
+# generate_rss_feedは記事リストを変更しないため、テスト間で共有する
+SINGLE_ARTICLE = [{
+    'title': 'テスト記事',
+    'link': 'https://example.com/test',
+    'description': 'テスト記事の説明',
+    'pubDate': '01 Jan 2023 12:00:00 +0000'
+}]
+
+MULTIPLE_ARTICLES = [
+    {
+        'title': '記事1',
+        'link': 'https://example.com/1',
+        'description': '記事1の説明',
+        'pubDate': '01 Jan 2023 12:00:00 +0000'
+    },
+    {
+        'title': '記事2',
+        'link': 'https://example.com/2',
+        'description': '記事2の説明',
+        'pubDate': '02 Jan 2023 12:00:00 +0000'
+    }
+]
+
+UNICODE_ARTICLES = [{
+    'title': 'Claude 4の発表 - 最新のAI技術',
+    'link': 'https://example.com/japanese',
+    'description': 'Anthropicが新しいClaude 4モデルを発表しました。日本語対応も強化されています。',
+    'pubDate': '01 Jan 2023 12:00:00 +0000'
+}]
+
+
+# translate_simpleの結果に含まれるべき語句（latest -> 最新, research -> 研究, news -> ニュース, AIはそのまま）
+BASIC_TRANSLATION_TERMS = frozenset({"最新", "AI", "研究", "ニュース"})
+# Anthropic関連キーワード（固有名詞はそのまま残る）
+ANTHROPIC_KEYWORD_TERMS = frozenset({"Anthropic", "Claude", "リリース", "アップデート"})
+
+# 語句の集合ごとに、結果を一度の走査で検査する正規表現をimport時にコンパイルしておく
+TERM_PATTERNS = {
+    terms: re.compile("|".join(map(re.escape, sorted(terms, key=len, reverse=True))))
+    for terms in (BASIC_TRANSLATION_TERMS, ANTHROPIC_KEYWORD_TERMS)
+}
+
+
+@pytest.fixture(scope="module")
+def single_article_rss():
+    """SINGLE_ARTICLEから生成したRSS要素（読み取り専用のテストで共有）"""
+    return generate_rss_feed(SINGLE_ARTICLE)
 
 
 class TestTranslateSimple:
     """translate_simple関数のテスト"""
     
-    def test_basic_translation(self):
-        """基本的な翻訳テスト"""
-        text = "This is the latest AI research news"
+    @pytest.mark.parametrize("text, expected_terms", [
+        ("This is the latest AI research news", BASIC_TRANSLATION_TERMS),
+        ("Anthropic announces new Claude update release", ANTHROPIC_KEYWORD_TERMS),
+    ], ids=["basic", "anthropic_keywords"])
+    def test_keyword_translation(self, text, expected_terms):
+        """キーワード翻訳のテスト（ケースごとにパラメータ化）"""
         result = translate_simple(text)
         
-        assert "最新" in result  # latest -> 最新
-        assert "AI" in result    # AI remains AI
-        assert "研究" in result  # research -> 研究
-        assert "ニュース" in result  # news -> ニュース
-    
-    def test_anthropic_keywords(self):
-        """Anthropic関連キーワードの翻訳テスト"""
-        text = "Anthropic announces new Claude update release"
-        result = translate_simple(text)
-        
-        assert "Anthropic" in result
-        assert "Claude" in result
-        assert "リリース" in result
-        assert "アップデート" in result
+        # 期待する語句がすべて含まれていること（集合の比較なので、失敗時は欠けた語句が表示される）
+        assert set(TERM_PATTERNS[expected_terms].findall(result)) == expected_terms
     
     def test_no_translation_needed(self):
         """翻訳不要なテキストのテスト"""
@@ -67,6 +104,29 @@ class TestTranslateSimple:
         assert "新しいs" not in result
 
 
+class TestTranslateArticles:
+    """translate_articles関数のテスト"""
+    
+    def test_batch_matches_per_field_translation(self):
+        """一括翻訳の結果がフィールドごとの翻訳と一致することのテスト"""
+        articles = [
+            {'title': 'Latest research news', 'description': 'A new safety update'},
+            {'title': 'Claude release', 'description': 'Blog post about machine learning'}
+        ]
+        expected = [
+            {'title': translate_simple(a['title']), 'description': translate_simple(a['description'])}
+            for a in articles
+        ]
+        
+        result = translate_articles(articles)
+        
+        assert result == expected
+    
+    def test_empty_list(self):
+        """空のリストのテスト"""
+        assert translate_articles([]) == []
+
+
 class TestFormatDate:
     """format_date関数のテスト"""
     
@@ -76,7 +136,12 @@ class TestFormatDate:
         result = format_date(date_str)
         assert "25 Dec 2023" in result
         assert "+0000" in result
-    
+
+    def test_iso_format_with_offset(self):
+        """タイムゾーン付きISO形式がUTCに変換されることのテスト"""
+        result = format_date("2023-12-25T10:30:00+09:00")
+        assert result == "25 Dec 2023 01:30:00 +0000"
+
     def test_invalid_date(self):
         """無効な日付フォーマットのテスト"""
         date_str = "invalid-date"
@@ -86,19 +151,17 @@ class TestFormatDate:
         assert "+0000" in result
         assert len(result.split()) == 5  # "DD MMM YYYY HH:MM:SS +0000"
     
-    def test_various_formats(self):
+    @pytest.mark.parametrize("date_str", [
+        "2023-12-25",
+        "2023-12-25T10:30:00",
+        "25 Dec 2023",
+        "December 25, 2023"
+    ])
+    def test_various_formats(self, date_str):
         """様々な日付フォーマットのテスト"""
-        test_cases = [
-            "2023-12-25",
-            "2023-12-25T10:30:00",
-            "25 Dec 2023",
-            "December 25, 2023"
-        ]
-        
-        for date_str in test_cases:
-            result = format_date(date_str)
-            assert "+0000" in result
-            assert len(result) > 10
+        result = format_date(date_str)
+        assert "+0000" in result
+        assert len(result) > 10
 
 
 class TestGenerateRssFeed:
@@ -125,107 +188,56 @@ class TestGenerateRssFeed:
         items = channel.findall("item")
         assert len(items) == 0
     
-    def test_single_article(self):
+    def test_single_article(self, single_article_rss):
         """単一記事のRSS生成テスト"""
-        articles = [{
-            'title': 'テスト記事',
-            'link': 'https://example.com/test',
-            'description': 'テスト記事の説明',
-            'pubDate': '01 Jan 2023 12:00:00 +0000'
-        }]
-        
-        rss_element = generate_rss_feed(articles)
-        channel = rss_element.find("channel")
+        channel = single_article_rss.find("channel")
         items = channel.findall("item")
         
         assert len(items) == 1
         
-        item = items[0]
-        assert item.find("title").text == "テスト記事"
-        assert item.find("link").text == "https://example.com/test"
-        assert item.find("description").text == "テスト記事の説明"
-        assert item.find("pubDate").text == "01 Jan 2023 12:00:00 +0000"
+        assert item_fields(items[0]) == {
+            "title": "テスト記事",
+            "link": "https://example.com/test",
+            "description": "テスト記事の説明",
+            "pubDate": "01 Jan 2023 12:00:00 +0000",
+        }
     
     def test_multiple_articles(self):
         """複数記事のRSS生成テスト"""
-        articles = [
-            {
-                'title': '記事1',
-                'link': 'https://example.com/1',
-                'description': '記事1の説明',
-                'pubDate': '01 Jan 2023 12:00:00 +0000'
-            },
-            {
-                'title': '記事2',
-                'link': 'https://example.com/2',
-                'description': '記事2の説明',
-                'pubDate': '02 Jan 2023 12:00:00 +0000'
-            }
-        ]
-        
-        rss_element = generate_rss_feed(articles)
+        rss_element = generate_rss_feed(MULTIPLE_ARTICLES)
         channel = rss_element.find("channel")
         items = channel.findall("item")
         
         assert len(items) == 2
-        assert items[0].find("title").text == "記事1"
-        assert items[1].find("title").text == "記事2"
+        assert [item_fields(item)["title"] for item in items] == ["記事1", "記事2"]
     
-    def test_rss_feed_validation(self):
+    def test_rss_feed_validation(self, single_article_rss):
         """生成されたRSSフィードの妥当性検証"""
-        sample_articles = [
-            {
-                'title': 'Validation Test',
-                'link': 'https://example.com/test',
-                'description': 'Test description',
-                'pubDate': '01 Jan 2023 12:00:00 +0000'
-            }
-        ]
+        rss_element = single_article_rss
         
-        rss_element = generate_rss_feed(sample_articles)
-        
-        # RSS 2.0仕様に準拠していることを確認
-        assert rss_element.tag == 'rss'
-        assert rss_element.get('version') == '2.0'
-        
-        channel = rss_element.find('channel')
-        assert channel is not None
-        
-        # 必須要素の存在確認
-        required_elements = ['title', 'link', 'description']
-        for element_name in required_elements:
-            element = channel.find(element_name)
-            assert element is not None
-            assert element.text is not None
-            assert len(element.text.strip()) > 0
+        # RSS 2.0仕様（rss@version、channel直下の空でないtitle/link/description）に準拠していることを確認
+        assert_valid_rss_structure(rss_element)
         
         # アイテムの妥当性確認
-        items = channel.findall('item')
+        required_elements = ['title', 'link', 'description']
+        items = rss_element.find('channel').findall('item')
         assert len(items) == 1
         
-        item = items[0]
+        fields = item_fields(items[0])
         for element_name in required_elements + ['pubDate']:
-            element = item.find(element_name)
-            assert element is not None
-            assert element.text is not None
-            assert len(element.text.strip()) > 0
+            text = fields.get(element_name)
+            assert text is not None
+            assert len(text.strip()) > 0
     
     def test_unicode_handling(self):
         """Unicode文字の処理テスト"""
-        articles = [{
-            'title': 'Claude 4の発表 - 最新のAI技術',
-            'link': 'https://example.com/japanese',
-            'description': 'Anthropicが新しいClaude 4モデルを発表しました。日本語対応も強化されています。',
-            'pubDate': '01 Jan 2023 12:00:00 +0000'
-        }]
-        
-        rss_element = generate_rss_feed(articles)
+        rss_element = generate_rss_feed(UNICODE_ARTICLES)
         channel = rss_element.find("channel")
-        item = channel.find("item")
+        fields = item_fields(channel.find("item"))
         
         # 日本語が正しく処理されることを確認
-        title = item.find("title").text
-        description = item.find("description").text
+        title = fields["title"]
+        description = fields["description"]
         
         assert "Claude 4の発表" in title
         assert "最新のAI技術" in title
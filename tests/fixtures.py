@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+テスト用のサンプルデータ・モックのフィクスチャ定義
+conftest.pyから一度だけ読み込まれる（テストモジュールから直接importしないこと）
+"""
+
+import pytest
+import json
+import types
+import functools
+import textwrap
+import lxml.html
+import lxml.etree as LET
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import scripts.generate_anthropic_rss as anthropic_rss
+from tests.openai.data import OPENAI_ARTICLES
+
+
+# 以下のサンプルデータはセッション全体で共有するため、辞書はMappingProxyType、
+# リストはタプルで読み取り専用にし、テスト間で変更が漏れないようにする
+@pytest.fixture(scope="session")
+def sample_article():
+    """サンプル記事データのフィクスチャ"""
+    return types.MappingProxyType({
+        'title': 'Test Article',
+        'link': 'https://example.com/test-article',
+        'description': 'This is a test article description',
+        'pubDate': '01 Jan 2023 12:00:00 +0000'
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_articles_list():
+    """複数のサンプル記事データのフィクスチャ"""
+    return (
+        types.MappingProxyType({
+            'title': 'First Article',
+            'link': 'https://example.com/first',
+            'description': 'First article description',
+            'pubDate': '01 Jan 2023 12:00:00 +0000'
+        }),
+        types.MappingProxyType({
+            'title': 'Second Article',
+            'link': 'https://example.com/second',
+            'description': 'Second article description',
+            'pubDate': '02 Jan 2023 12:00:00 +0000'
+        })
+    )
+
+
+@pytest.fixture(scope="session")
+def anthropic_sample_articles():
+    """Anthropic特有のサンプル記事データ"""
+    return (
+        types.MappingProxyType({
+            'title': 'Claude 4の発表',
+            'link': 'https://www.anthropic.com/news/claude-4-announcement',
+            'description': 'Anthropicが新しいClaude 4モデルを発表しました',
+            'pubDate': '01 Jan 2023 12:00:00 +0000'
+        }),
+        types.MappingProxyType({
+            'title': 'Constitutional AI研究の進展',
+            'link': 'https://www.anthropic.com/news/constitutional-ai-progress',
+            'description': 'Constitutional AIの研究で新たな成果を発表',
+            'pubDate': '02 Jan 2023 12:00:00 +0000'
+        })
+    )
+
+
+@pytest.fixture(scope="session")
+def anthropic_unicode_articles():
+    """日本語と英語の技術用語が混在するAnthropic記事データ"""
+    return (
+        types.MappingProxyType({
+            'title': 'Claude 4 リリース - Constitutional AI技術',
+            'link': 'https://www.anthropic.com/news/claude-4-constitutional-ai',
+            'description': 'AnthropicがConstitutional AIを使った新しいClaude 4モデルを発表。RLHF技術も改良されています。',
+            'pubDate': '01 Jan 2023 12:00:00 +0000'
+        }),
+    )
+
+
+@pytest.fixture(scope="session")
+def openai_sample_articles():
+    """OpenAI特有のサンプル記事データ（フィクスチャが必要な場合のみ。通常はtests.openai.dataを直接importする）"""
+    return OPENAI_ARTICLES
+
+
+# 呼び出し回数を検証しないドライバー類はMockではなくSimpleNamespaceで軽量に用意する
+# （assert_called系の検証が必要なテストでは、テスト側でMock(spec_set=...)を使う）
+@pytest.fixture
+def mock_selenium_driver():
+    """Seleniumドライバーのモックフィクスチャ"""
+    return types.SimpleNamespace(
+        page_source="<html><body>Mock content</body></html>",
+        get=lambda *args, **kwargs: None,
+        quit=lambda: None,
+        # WebDriverWaitの要素待ち（presence_of_element_located）が即座に成功するようにする
+        find_element=lambda *args, **kwargs: object()
+    )
+
+
+@pytest.fixture
+def mock_webdriver_wait():
+    """WebDriverWaitのモックフィクスチャ"""
+    wait_instance = types.SimpleNamespace(until=lambda *args, **kwargs: True)
+    return lambda *args, **kwargs: wait_instance
+
+
+# HTMLサンプルに埋め込む記事JSON。HTMLはimport時に一度だけ組み立て、
+# 記事データだけが必要なテストはsample_parsed_articlesで解析済みの値を使う
+SAMPLE_ARTICLES_JSON = {
+    "articles": [
+        {
+            "title": "Sample Article from HTML",
+            "slug": {"current": "/news/sample-article"},
+            "publishedOn": "2023-12-25T10:30:00Z",
+            "description": "This is a sample article from HTML"
+        }
+    ]
+}
+
+SAMPLE_HTML_WITH_ARTICLES = f"""
+<html>
+    <head>
+        <script type="application/json">{json.dumps(SAMPLE_ARTICLES_JSON)}</script>
+    </head>
+    <body>
+        <a href="/news/sample-article">Sample Article from HTML</a>
+    </body>
+</html>
+"""
+
+
+@pytest.fixture(scope="session")
+def sample_html_with_articles():
+    """記事を含むHTMLサンプル"""
+    return SAMPLE_HTML_WITH_ARTICLES
+
+
+@pytest.fixture(scope="session")
+def sample_parsed_articles():
+    """sample_html_with_articlesに埋め込まれた記事JSONの解析済みデータ（読み取り専用）"""
+    return types.MappingProxyType({
+        "articles": tuple(
+            types.MappingProxyType(article) for article in SAMPLE_ARTICLES_JSON["articles"]
+        )
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_empty_html():
+    """空のHTMLサンプル"""
+    return "<html><head></head><body></body></html>"
+
+
+@pytest.fixture(scope="session")
+def workflow_page_source():
+    """エンドツーエンドワークフローテスト用のニュースページHTML（セッションで一度だけ組み立てる）"""
+    return textwrap.dedent("""\
+        <html>
+            <head>
+                <script type="application/json">
+                {
+                    "articles": [
+                        {
+                            "title": "Anthropic's Latest AI Research",
+                            "slug": {"current": "/news/anthropic-latest-research"},
+                            "publishedOn": "2023-12-25T10:30:00Z",
+                            "description": "Breakthrough in AI alignment and safety research"
+                        }
+                    ]
+                }
+                </script>
+            </head>
+        </html>
+        """)
+
+
+@pytest.fixture(scope="class")
+def workflow_driver(workflow_page_source):
+    """workflow_page_sourceを返すSeleniumドライバーのMock（テストクラスごとに一度だけ生成する）"""
+    # 要素待ち（find_element）を含め、fetch_page_source_with_seleniumが使う属性だけに限定する
+    return Mock(spec_set=['get', 'quit', 'page_source', 'find_element'], page_source=workflow_page_source)
+
+
+@pytest.fixture
+def mock_driver(workflow_driver):
+    """呼び出し記録をリセットしたworkflow_driver（assert_called系の検証がテスト間で混ざらないようにする）"""
+    workflow_driver.reset_mock()
+    return workflow_driver
+
+
+@pytest.fixture(scope="session")
+def parsed_html_tree():
+    """HTML文字列をlxmlで解析する関数のフィクスチャ（同じ文字列は一度だけ解析）"""
+    # 抽出処理はツリーを読むだけなので、解析済みツリーをテスト間で共有できる
+    @functools.lru_cache(maxsize=None)
+    def parse(html):
+        return lxml.html.fromstring(html)
+    return parse
+
+
+@pytest.fixture(scope="session")
+def parsed_news_links():
+    """HTML文字列をAnthropicのparse_news_linksで解析する関数のフィクスチャ（同じ文字列は一度だけ解析）"""
+    # extract_articles_from_linksもツリーを読むだけなので、解析結果をテスト間で共有できる
+    return functools.lru_cache(maxsize=None)(anthropic_rss.parse_news_links)
+
+
+@pytest.fixture(scope="session")
+def mock_current_time():
+    """現在時刻のモック"""
+    return datetime(2023, 12, 25, 12, 0, 0)
+
+
+# generated_rssに渡す種類と、main()に渡す記事データのフィクスチャ名（Noneは記事なし）
+GENERATED_RSS_ARTICLES = {
+    'standard': 'anthropic_sample_articles',
+    'empty': None,
+    'unicode': 'anthropic_unicode_articles',
+}
+
+
+@pytest.fixture(scope="session")
+def generated_rss(request, tmp_path_factory):
+    """記事データの種類ごとにmain()を一度だけ実行し、生成されたRSSを(lxmlのルート要素, 本文のバイト列)で返す関数のフィクスチャ
+
+    テストでは generated_rss('standard') のように呼ぶ。main()は記事データが同じなら同じRSSを出力するため、
+    同じ種類を指定したテストはセッション全体で生成・解析結果を共有する（結果は読み取り専用として扱うこと）。
+    """
+    results = {}
+    
+    def generate(kind):
+        if kind not in results:
+            fixture_name = GENERATED_RSS_ARTICLES[kind]
+            # セッション共有のデータなのでリストに写して渡す
+            articles = list(request.getfixturevalue(fixture_name)) if fixture_name else []
+            output_dir = tmp_path_factory.mktemp(f"rss-{kind}")
+            
+            with pytest.MonkeyPatch.context() as mp, \
+                 patch('scripts.generate_anthropic_rss.scrape_anthropic_news', return_value=articles), \
+                 patch('scripts.generate_anthropic_rss.load_existing_articles', return_value={}):
+                mp.chdir(output_dir)
+                anthropic_rss.main()
+            
+            # XML宣言付きの文書はlxmlにバイト列で渡す
+            rss_bytes = (output_dir / 'dist' / 'anthropic-news.xml').read_bytes()
+            results[kind] = (LET.fromstring(rss_bytes), rss_bytes)
+        return results[kind]
+    
+    return generate
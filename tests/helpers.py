@@ -0,0 +1,83 @@
+"""
+テスト共通のアサーションヘルパー
+テストモジュールから from tests.helpers import ... で読み込んで使う
+"""
+
+import re
+import xml.etree.ElementTree as ET
+
+import lxml.etree as LET
+
+
+# RSS 2.0の最小構造（rss@version="2.0"、channel直下に空でないtitle/link/description）を表すRelaxNG
+RSS_RNG = """
+<grammar xmlns="http://relaxng.org/ns/structure/1.0"
+         datatypeLibrary="http://www.w3.org/2001/XMLSchema-datatypes">
+  <start>
+    <element name="rss">
+      <attribute name="version"><value>2.0</value></attribute>
+      <element name="channel">
+        <interleave>
+          <element name="title"><ref name="nonEmptyText"/></element>
+          <element name="link"><ref name="nonEmptyText"/></element>
+          <element name="description"><ref name="nonEmptyText"/></element>
+          <zeroOrMore><ref name="otherElement"/></zeroOrMore>
+        </interleave>
+      </element>
+    </element>
+  </start>
+  <define name="nonEmptyText">
+    <data type="token"><param name="minLength">1</param></data>
+  </define>
+  <define name="otherElement">
+    <element>
+      <anyName><except><name>title</name><name>link</name><name>description</name></except></anyName>
+      <ref name="anyContent"/>
+    </element>
+  </define>
+  <define name="anyContent">
+    <zeroOrMore>
+      <choice>
+        <attribute><anyName/></attribute>
+        <text/>
+        <element><anyName/><ref name="anyContent"/></element>
+      </choice>
+    </zeroOrMore>
+  </define>
+</grammar>
+"""
+RSS_SCHEMA = LET.RelaxNG(LET.fromstring(RSS_RNG))
+
+
+# カスタムアサーション関数
+def assert_valid_rss_structure(rss_element):
+    """RSS構造の妥当性をチェックするヘルパー関数（RSS_SCHEMAで一度に検証する）"""
+    # generate_rss_feedは標準ライブラリのElementを返すため、lxmlのツリーに変換して検証する
+    RSS_SCHEMA.assertValid(LET.fromstring(ET.tostring(rss_element)))
+
+
+def item_fields(item):
+    """RSSのitem要素の子要素を一度だけ走査し、{タグ名: テキスト}の辞書にする"""
+    return {child.tag: child.text for child in item}
+
+
+# RSS用のpubDate（"DD Mon YYYY HH:MM:SS +0000"）とリンクの形式。年は1グループ目で取り出せる
+PUBDATE_RE = re.compile(r'\d{2} [A-Z][a-z]{2} (\d{4}) \d{2}:\d{2}:\d{2} \+0000')
+LINK_RE = re.compile(r'https?://')
+
+
+def assert_valid_article_structure(article):
+    """記事データ構造の妥当性をチェックするヘルパー関数（pubDateのマッチ結果を返す）"""
+    required_fields = ['title', 'link', 'description', 'pubDate']
+    for field in required_fields:
+        assert field in article
+        assert article[field] is not None
+        assert len(str(article[field]).strip()) > 0
+    
+    # URLの形式チェック
+    assert LINK_RE.match(article['link'])
+    
+    # 日付形式のチェック（正規表現1回で全体の形式を検証する）
+    match = PUBDATE_RE.fullmatch(article['pubDate'])
+    assert match
+    return match
@@ -1,10 +1,6 @@
 import pytest
-import os
 import xml.etree.ElementTree as ET
-import sys
 
-# プロジェクトルートをパスに追加
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
 from scripts.generate_ollama_rss import translate_simple, parse_relative_date, fetch_ollama_models, generate_rss
 
 @pytest.mark.ollama
@@ -57,6 +53,8 @@ def test_generate_rss():
 
 @pytest.mark.ollama
 @pytest.mark.integration
+@pytest.mark.serial
+@pytest.mark.slow
 def test_fetch_ollama_models():
     """Integration test to fetch real data (if internet is available)."""
     articles = fetch_ollama_models()
@@ -0,0 +1,27 @@
+"""
+OpenAIテスト共通のサンプル記事データ。
+読み取り専用（MappingProxyTypeのタプル）なので、テスト間でそのまま共有する。
+"""
+
+from types import MappingProxyType
+
+OPENAI_ARTICLES = (
+    MappingProxyType({
+        'title': 'June 24, 2025: Chat search connectors (Pro)',
+        'link': 'https://help.openai.com/en/articles/6825453-chatgpt-release-notes',
+        'description': 'Pro users are now able to use chat search connectors for Dropbox, Box, Google Drive integration.',
+        'pubDate': '24 Jun 2025 12:00:00 +0000'
+    }),
+    MappingProxyType({
+        'title': 'June 18, 2025: ChatGPT record mode',
+        'link': 'https://help.openai.com/en/articles/6825453-chatgpt-release-notes',
+        'description': 'Capture meetings, brainstorms, or voice notes. Available for Pro, Enterprise, and Edu users.',
+        'pubDate': '18 Jun 2025 12:00:00 +0000'
+    }),
+    MappingProxyType({
+        'title': 'June 13, 2025: Improvements to ChatGPT search response quality',
+        'link': 'https://help.openai.com/en/articles/6825453-chatgpt-release-notes',
+        'description': 'Upgraded ChatGPT search for all users to provide more comprehensive, up-to-date responses.',
+        'pubDate': '13 Jun 2025 12:00:00 +0000'
+    })
+)
@@ -3,20 +3,91 @@ OpenAI ChatGPT Release Notes固有のスクレイピング機能をテストす
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from datetime import datetime
-import sys
 import os
+import json
 
-# プロジェクトルートをパスに追加
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../'))
-
+import scripts.generate_openai_rss as openai_rss
 from scripts.generate_openai_rss import (
     parse_openai_date,
     extract_openai_articles,
     scrape_openai_releases,
+    scrape_with_requests,
+    extract_openai_articles_from_tree,
     translate_simple
 )
+from tests.helpers import PUBDATE_RE
+
+# 解析に失敗した日付のフォールバック（現在日時）を検証するための固定時刻
+FIXED_NOW = datetime(2025, 6, 30, 12, 0, 0)
+
+
+class FrozenDatetime(datetime):
+    """now()が常にFIXED_NOWを返すdatetime"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_NOW
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """scripts.generate_openai_rssのdatetimeを固定時刻版に差し替えるフィクスチャ"""
+    monkeypatch.setattr(openai_rss, 'datetime', FrozenDatetime)
+    return FIXED_NOW
+
+# HTML構造解析テスト用の入力（parsed_html_treeで一度だけ解析して共有する）
+HTML_STRUCTURED = """
+<div class="prose">
+    <h1 id="h_d015741d75">June 24, 2025</h1>
+    <h2 id="h_fab7aa1610"><b>Chat search connectors (Pro)</b></h2>
+    <p class="no-margin">Pro users are now able to use chat search connectors.</p>
+    <h2 id="h_f2f58eebf7"><b>Project file limit increased (Pro)</b></h2>
+    <p class="no-margin">Projects can now support 40 uploaded files, up from 20.</p>
+    <h1 id="h_9e009b6b34">June 18, 2025</h1>
+    <h2 id="h_2e5af39d39"><b>ChatGPT record mode</b></h2>
+    <p class="no-margin">Capture meetings, brainstorms, or voice notes.</p>
+</div>
+"""
+
+HTML_LIST = """
+<div class="prose">
+    <h1 id="h_test">May 1, 2025</h1>
+    <h2 id="h_feature"><b>New Features</b></h2>
+    <p class="no-margin">Multiple improvements:</p>
+    <ul>
+        <li><p class="no-margin">Feature A improvement</p></li>
+        <li><p class="no-margin">Feature B enhancement</p></li>
+        <li><p class="no-margin">Feature C addition</p></li>
+    </ul>
+</div>
+"""
+
+# 日付セクションがコンテナ要素に包まれている場合（h1はdiv.proseの直下にない）
+HTML_NESTED = """
+<div class="prose">
+    <section>
+        <h1>June 24, 2025</h1>
+        <h2><b>Chat search connectors (Pro)</b></h2>
+        <p class="no-margin">Pro users are now able to use chat search connectors.</p>
+    </section>
+    <section>
+        <h1>June 18, 2025</h1>
+        <h2><b>ChatGPT record mode</b></h2>
+        <p class="no-margin">Capture meetings, brainstorms, or voice notes.</p>
+    </section>
+</div>
+"""
+
+HTML_EMPTY = "<div></div>"
+
+HTML_NO_PROSE = """
+<div class="other-class">
+    <h1>June 24, 2025</h1>
+    <h2>Some Feature</h2>
+</div>
+"""
 
 @pytest.mark.openai
 class TestOpenAIDateParsing:
@@ -25,45 +96,38 @@ class TestOpenAIDateParsing:
     def test_parse_standard_date_format(self):
         """標準的な日付フォーマットのテスト"""
         result = parse_openai_date("June 24, 2025")
-        assert "24 Jun 2025" in result
-        assert "+0000" in result
+        assert result.startswith("24 Jun 2025")
+        assert PUBDATE_RE.fullmatch(result)
     
     def test_parse_abbreviated_month_format(self):
         """月の略称フォーマットのテスト"""
         result = parse_openai_date("May 15, 2025")
         assert "15 May 2025" in result
+
+    def test_parse_numeric_date_formats(self):
+        """数値形式（m/d/Y, Y-m-d）と短縮月名の日付フォーマットのテスト"""
+        assert parse_openai_date("06/24/2025").startswith("24 Jun 2025")
+        assert parse_openai_date("2025-06-24").startswith("24 Jun 2025")
+        assert parse_openai_date("Jun 24, 2025").startswith("24 Jun 2025")
     
-    def test_parse_invalid_date_returns_current(self):
+    def test_parse_invalid_date_returns_current(self, frozen_now):
         """無効な日付の場合は現在日時を返すテスト"""
         result = parse_openai_date("Invalid Date")
-        current_year = str(datetime.now().year)
-        assert current_year in result
+        assert result == frozen_now.strftime('%d %b %Y %H:%M:%S +0000')
     
-    def test_parse_empty_date_returns_current(self):
+    def test_parse_empty_date_returns_current(self, frozen_now):
         """空の日付の場合は現在日時を返すテスト"""
         result = parse_openai_date("")
-        assert "+0000" in result
+        assert result == "30 Jun 2025 12:00:00 +0000"
+        assert PUBDATE_RE.fullmatch(result)
 
 @pytest.mark.openai
 class TestOpenAIHTMLStructureParsing:
     """OpenAI固有のHTML構造解析テスト"""
     
-    def test_extract_articles_from_structured_html(self):
+    def test_extract_articles_from_structured_html(self, parsed_html_tree):
         """構造化されたHTMLからの記事抽出テスト"""
-        html_content = """
-        <div class="prose">
-            <h1 id="h_d015741d75">June 24, 2025</h1>
-            <h2 id="h_fab7aa1610"><b>Chat search connectors (Pro)</b></h2>
-            <p class="no-margin">Pro users are now able to use chat search connectors.</p>
-            <h2 id="h_f2f58eebf7"><b>Project file limit increased (Pro)</b></h2>
-            <p class="no-margin">Projects can now support 40 uploaded files, up from 20.</p>
-            <h1 id="h_9e009b6b34">June 18, 2025</h1>
-            <h2 id="h_2e5af39d39"><b>ChatGPT record mode</b></h2>
-            <p class="no-margin">Capture meetings, brainstorms, or voice notes.</p>
-        </div>
-        """
-        
-        articles = extract_openai_articles(html_content, "https://help.openai.com")
+        articles = extract_openai_articles_from_tree(parsed_html_tree(HTML_STRUCTURED), "https://help.openai.com")
         
         # 3つの記事が抽出されることを確認
         assert len(articles) == 3
@@ -75,22 +139,19 @@ class TestOpenAIHTMLStructureParsing:
         assert first_article['link'] == "https://help.openai.com"
         assert "Jun 2025" in first_article['pubDate']
     
-    def test_extract_articles_with_list_content(self):
-        """リスト形式のコンテンツを含む記事の抽出テスト"""
-        html_content = """
-        <div class="prose">
-            <h1 id="h_test">May 1, 2025</h1>
-            <h2 id="h_feature"><b>New Features</b></h2>
-            <p class="no-margin">Multiple improvements:</p>
-            <ul>
-                <li><p class="no-margin">Feature A improvement</p></li>
-                <li><p class="no-margin">Feature B enhancement</p></li>
-                <li><p class="no-margin">Feature C addition</p></li>
-            </ul>
-        </div>
-        """
+    def test_extract_articles_from_nested_sections(self, parsed_html_tree):
+        """コンテナ要素に包まれた日付見出しからも記事が抽出されることのテスト"""
+        articles = extract_openai_articles_from_tree(parsed_html_tree(HTML_NESTED), "https://help.openai.com")
         
-        articles = extract_openai_articles(html_content, "https://help.openai.com")
+        assert len(articles) == 2
+        assert "Chat search connectors" in articles[0]['title']
+        assert "24 Jun 2025" in articles[0]['pubDate']
+        assert "ChatGPT record mode" in articles[1]['title']
+        assert "18 Jun 2025" in articles[1]['pubDate']
+    
+    def test_extract_articles_with_list_content(self, parsed_html_tree):
+        """リスト形式のコンテンツを含む記事の抽出テスト"""
+        articles = extract_openai_articles_from_tree(parsed_html_tree(HTML_LIST), "https://help.openai.com")
         
         assert len(articles) == 1
         article = articles[0]
@@ -98,22 +159,42 @@ class TestOpenAIHTMLStructureParsing:
         # リストアイテムが説明に含まれていることを確認（翻訳後も考慮）
         assert "• Feature A" in article['description']
         assert "• Feature B" in article['description']
-    
-    def test_extract_articles_empty_content(self):
-        """空のコンテンツの場合のテスト"""
-        html_content = "<div></div>"
-        articles = extract_openai_articles(html_content, "https://help.openai.com")
-        assert len(articles) == 0
-    
-    def test_extract_articles_no_prose_class(self):
-        """prose classが見つからない場合のテスト"""
+
+    def test_description_keeps_first_three_parts(self):
+        """説明文が先頭3パートまでに制限されることのテスト"""
         html_content = """
-        <div class="other-class">
-            <h1>June 24, 2025</h1>
-            <h2>Some Feature</h2>
+        <div class="prose">
+            <h1>May 1, 2025</h1>
+            <h2>Update</h2>
+            <p>Part one</p>
+            <p>Part two</p>
+            <p>Part three</p>
+            <p>Part four</p>
         </div>
         """
+
         articles = extract_openai_articles(html_content, "https://help.openai.com")
+
+        assert articles[0]['description'] == "Part one Part two Part three"
+
+    def test_stops_at_max_articles(self):
+        """max_articles件に達したら残りの機能を解析しないことのテスト"""
+        features = ''.join(f"<h2>Entry {i}</h2><p>Details {i}</p>" for i in range(5))
+        html_content = f'<div class="prose"><h1>May 1, 2025</h1>{features}</div>'
+
+        articles = extract_openai_articles(html_content, "https://help.openai.com", max_articles=3)
+
+        assert len(articles) == 3
+        assert "Entry 2" in articles[-1]['title']
+
+    def test_extract_articles_empty_content(self, parsed_html_tree):
+        """空のコンテンツの場合のテスト"""
+        articles = extract_openai_articles_from_tree(parsed_html_tree(HTML_EMPTY), "https://help.openai.com")
+        assert len(articles) == 0
+    
+    def test_extract_articles_no_prose_class(self, parsed_html_tree):
+        """prose classが見つからない場合のテスト"""
+        articles = extract_openai_articles_from_tree(parsed_html_tree(HTML_NO_PROSE), "https://help.openai.com")
         assert len(articles) == 0
 
 @pytest.mark.openai
@@ -137,18 +218,97 @@ class TestOpenAITranslation:
         assert "GPT-4" in result
         assert "AI" in result
         assert "モデル" in result
+    
+    def test_translate_simple_is_pure(self):
+        """キャッシュしてよいよう、translate_simpleが同じ入力に同じ結果を返すことのテスト"""
+        text = "ChatGPT release notes with new features"
+        
+        # キャッシュを空にしてから実際に計算した結果と、キャッシュからの結果・キャッシュなしの元の関数の結果を比べる
+        translate_simple.cache_clear()
+        computed = translate_simple(text)
+        assert translate_simple(text) == computed
+        assert translate_simple.__wrapped__(text) == computed
+
+@pytest.mark.openai
+class TestOpenAIRequestsScraping:
+    """requestsによる取得経路のテスト"""
+    
+    @patch('scripts.generate_openai_rss.setup_driver')
+    @patch('scripts.generate_openai_rss.scrape_with_requests')
+    def test_requests_success_skips_selenium(self, mock_requests, mock_setup):
+        """requestsで記事が取得できた場合にSeleniumを起動しないことのテスト"""
+        mock_requests.return_value = [
+            {
+                'title': 'requests記事',
+                'link': 'https://help.openai.com/test',
+                'description': 'requests説明',
+                'pubDate': '01 Jun 2025 12:00:00 +0000'
+            }
+        ]
+        
+        result = scrape_openai_releases()
+        
+        assert len(result) == 1
+        assert result[0]['title'] == 'requests記事'
+        mock_setup.assert_not_called()
+    
+    @pytest.mark.selenium
+    @pytest.mark.usefixtures("selenium_env")
+    @patch.dict(os.environ, {'USE_SELENIUM': '1'})
+    @patch('scripts.generate_openai_rss.setup_driver')
+    @patch('scripts.generate_openai_rss.scrape_with_requests')
+    def test_use_selenium_env_skips_requests(self, mock_requests, mock_setup):
+        """USE_SELENIUM=1の場合にrequestsを使わずSeleniumを使うことのテスト"""
+        mock_setup.side_effect = Exception("Driver setup failed")
+        
+        scrape_openai_releases()
+        
+        mock_requests.assert_not_called()
+        mock_setup.assert_called_once()
+
+    @patch('scripts.generate_openai_rss.SESSION.get')
+    def test_response_without_prose_returns_empty(self, mock_get, tmp_path):
+        """proseコンテナのないレスポンスではSeleniumに任せるため空リストを返すことのテスト"""
+        mock_get.return_value = Mock(
+            status_code=200, text='<html><body><div id="app"></div></body></html>', headers={}
+        )
+
+        assert scrape_with_requests('https://help.openai.com/test', str(tmp_path / 'page.json')) == []
+
+    @patch('scripts.generate_openai_rss.SESSION.get')
+    def test_not_modified_uses_cached_body(self, mock_get, tmp_path):
+        """304応答の場合にキャッシュ済みのHTMLから記事を抽出することのテスト"""
+        cache_path = tmp_path / 'page.json'
+        cache_path.write_text(json.dumps({
+            'url': 'https://help.openai.com/test',
+            'etag': '"v1"',
+            'last_modified': None,
+            'body': '<div class="prose"><h1>June 24, 2025</h1><h2>Cached entry</h2><p>Details</p></div>'
+        }), encoding='utf-8')
+        mock_get.return_value = Mock(status_code=304, text='', headers={})
+
+        articles = scrape_with_requests('https://help.openai.com/test', str(cache_path))
 
+        assert len(articles) == 1
+        assert 'Cached entry' in articles[0]['title']
+        sent_headers = mock_get.call_args[1]['headers']
+        assert sent_headers['If-None-Match'] == '"v1"'
+        assert 'If-Modified-Since' not in sent_headers
+
+# requestsでの取得は失敗したものとして扱い、Seleniumの経路をテストする
 @pytest.mark.openai
-@pytest.mark.slow
+@pytest.mark.selenium
+@pytest.mark.usefixtures("selenium_env")
+@patch('scripts.generate_openai_rss.scrape_with_requests', Mock(return_value=[]))
 class TestOpenAIWebScraping:
     """OpenAI Webスクレイピング統合テスト（実際のネットワークアクセスを含む）"""
     
     @patch('scripts.generate_openai_rss.setup_driver')
-    @patch('scripts.generate_openai_rss.extract_openai_articles')
+    @patch('scripts.generate_openai_rss.extract_openai_articles_from_tree')
     def test_successful_scraping_with_mocked_driver(self, mock_extract, mock_setup):
         """Seleniumドライバーをモックした成功ケーステスト"""
-        # モックドライバーの設定
-        mock_driver = Mock()
+        # モックドライバーの設定（呼び出し回数を検証するためMockを使い、属性はspec_setで限定する）
+        mock_driver = Mock(spec_set=['get', 'quit', 'page_source', 'find_element'])
         mock_driver.page_source = "<html><body>Mock content</body></html>"
         mock_setup.return_value = mock_driver
         
@@ -175,11 +335,12 @@ class TestOpenAIWebScraping:
         mock_driver.get.assert_called_once()
         mock_driver.quit.assert_called_once()
     
-    @patch('scripts.generate_openai_rss.setup_driver')
-    def test_scraping_failure_returns_fallback(self, mock_setup):
+    def test_scraping_failure_returns_fallback(self, monkeypatch):
         """スクレイピング失敗時のフォールバック記事テスト"""
-        # ドライバー設定でエラーを発生させる
-        mock_setup.side_effect = Exception("Driver setup failed")
+        # ドライバー設定でエラーを発生させる（呼び出し検証は不要なので直接差し替える）
+        def failing_setup_driver():
+            raise Exception("Driver setup failed")
+        monkeypatch.setattr(openai_rss, 'setup_driver', failing_setup_driver)
         
         result = scrape_openai_releases()
         
@@ -189,14 +350,13 @@ class TestOpenAIWebScraping:
         assert "公式サイト" in result[0]['description']
     
     @patch('scripts.generate_openai_rss.setup_driver')
-    def test_scraping_with_no_articles_returns_fallback(self, mock_setup):
+    def test_scraping_with_no_articles_returns_fallback(self, mock_setup, mock_selenium_driver):
         """記事が見つからない場合のフォールバックテスト"""
         # モックドライバーの設定（記事が見つからない）
-        mock_driver = Mock()
-        mock_driver.page_source = "<html><body>No articles found</body></html>"
-        mock_setup.return_value = mock_driver
+        mock_selenium_driver.page_source = "<html><body>No articles found</body></html>"
+        mock_setup.return_value = mock_selenium_driver
         
-        with patch('scripts.generate_openai_rss.extract_openai_articles') as mock_extract, \
+        with patch('scripts.generate_openai_rss.extract_openai_articles_from_tree') as mock_extract, \
              patch('scripts.generate_openai_rss.get_static_backup_articles') as mock_backup:
             mock_extract.return_value = []  # 空の記事リスト
             mock_backup.return_value = []   # バックアップも空